@@ -0,0 +1,134 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    # Everything below also works on plain array columns, just slower
+    np = None
+
+class SalesAnalytics:
+    """Group-by reports over a showroom's sales.
+
+    Sales are copied into typed columns (brand code, model year, price)
+    once; refresh() only appends the sales made since the last call, as
+    sales are only ever taken back by an undo, after which reset() starts
+    over. With NumPy installed each report is a few bincount calls over
+    the columns; without it the same reports are computed in one pass of
+    plain Python over the arrays.
+    """
+
+    def __init__(self, showroom):
+        self.showroom = showroom
+        self.reset()
+
+    def reset(self):
+        """Drop the copied sales; the next report copies them all again."""
+        self.brands = []
+        self._brand_codes = {}
+        self._brand_column = array('I')
+        self._year_column = array('q')
+        self._price_column = array('d')
+
+    def __len__(self):
+        return len(self._price_column)
+
+    def refresh(self):
+        """Copy in sales made since the last refresh. Returns how many."""
+        start = len(self._price_column)
+        for sale in self.showroom.iter_sales(start):
+            car = sale['car']
+            code = self._brand_codes.get(car.brand)
+            if code is None:
+                code = self._brand_codes[car.brand] = len(self.brands)
+                self.brands.append(car.brand)
+            self._brand_column.append(code)
+            self._year_column.append(car.year)
+            self._price_column.append(sale['price'])
+        return len(self._price_column) - start
+
+    def _columns(self):
+        self.refresh()
+        if np is None:
+            return self._brand_column, self._year_column, self._price_column
+        return (np.frombuffer(self._brand_column, dtype=np.uint32),
+                np.frombuffer(self._year_column, dtype=np.int64),
+                np.frombuffer(self._price_column, dtype=np.float64))
+
+    def revenue_by_brand(self):
+        """{brand: (sales, revenue)}, highest revenue first."""
+        brands, _, prices = self._columns()
+        counts, totals = _group_sums(brands, prices, len(self.brands))
+        result = {self.brands[code]: (counts[code], totals[code]) for code in range(len(self.brands))}
+        return dict(sorted(result.items(), key=lambda item: -item[1][1]))
+
+    def average_price_by_year(self):
+        """{model year: (sales, average sale price)}, oldest first."""
+        _, years, prices = self._columns()
+        if not len(years):
+            return {}
+        counts, totals, first = _group_sums_by_value(years, prices)
+        return {first + i: (counts[i], totals[i] / counts[i]) for i in range(len(counts)) if counts[i]}
+
+    def price_bands(self, band_width=10000):
+        """[(low, high, sales, revenue)] for each band_width-wide price band
+        from the cheapest sale to the dearest; empty bands included so the
+        result reads as a histogram."""
+        _, _, prices = self._columns()
+        if not len(prices):
+            return []
+        if np is not None:
+            bands = (prices // band_width).astype(np.int64)
+        else:
+            bands = array('q', (int(price // band_width) for price in prices))
+        counts, totals, first = _group_sums_by_value(bands, prices)
+        return [((first + i) * band_width, (first + i + 1) * band_width, counts[i], totals[i])
+                for i in range(len(counts))]
+
+def _group_sums(groups, values, size):
+    """Per group g in range(size): (number of rows, sum of values)."""
+    if np is not None:
+        counts = np.bincount(groups, minlength=size)
+        totals = np.bincount(groups, weights=values, minlength=size)
+        return counts.tolist(), totals.tolist()
+    counts = [0] * size
+    totals = [0.0] * size
+    for group, value in zip(groups, values):
+        counts[group] += 1
+        totals[group] += value
+    return counts, totals
+
+def _group_sums_by_value(keys, values):
+    """_group_sums for integer keys over a dense range, such as years or
+    price bands. Returns (counts, totals, first key)."""
+    if np is not None:
+        first, last = int(keys.min()), int(keys.max())
+        return (*_group_sums(keys - first, values, last - first + 1), first)
+    first, last = min(keys), max(keys)
+    return (*_group_sums([key - first for key in keys], values, last - first + 1), first)
+
+def format_report(analytics, band_width=10000):
+    """The three reports as text, for the CLI and the GUI tabs."""
+    analytics.refresh()
+    if not len(analytics):
+        return "No sales recorded yet."
+    showroom = analytics.showroom
+    lines = ["Sales So Far:"]
+    for label, period in (("Today", "day"), ("This week", "week"), ("This month", "month")):
+        count, revenue = showroom.sales_this(period)
+        lines.append(f"  {label:<16} {count:>8} sold  ${revenue:>14,.0f}")
+    lines.append("")
+    lines.append("Revenue by Brand:")
+    for brand, (count, revenue) in analytics.revenue_by_brand().items():
+        lines.append(f"  {brand:<16} {count:>8} sold  ${revenue:>14,.0f}")
+    lines.append("")
+    lines.append("Average Sale Price by Model Year:")
+    for year, (count, average) in analytics.average_price_by_year().items():
+        lines.append(f"  {year:<16} {count:>8} sold  ${average:>14,.0f}")
+    lines.append("")
+    lines.append("Sales by Price Band:")
+    bands = analytics.price_bands(band_width)
+    widest = max(count for _, _, count, _ in bands) or 1
+    for low, high, count, _ in bands:
+        bar = "#" * round(30 * count / widest)
+        lines.append(f"  ${low:>9,.0f} - ${high:>9,.0f} {count:>8}  {bar}")
+    return "\n".join(lines) + "\n"
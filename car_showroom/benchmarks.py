@@ -0,0 +1,306 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from car_showroom import Car, Customer, Showroom
+
+BRANDS = ["Toyota", "Honda", "Ford", "BMW", "Mercedes", "Audi", "Kia", "Mazda"]
+MODELS = ["Camry", "Civic", "Mustang", "X5", "C-Class", "A4", "Rio", "CX-5"]
+
+def make_cars(count, start_id=0, seed=0):
+    rng = random.Random(seed)
+    return [Car(car_id, rng.choice(BRANDS), rng.choice(MODELS), rng.randint(2000, 2024), rng.randint(10, 90) * 1000)
+            for car_id in range(start_id, start_id + count)]
+
+def make_customers(count, seed=0):
+    return [Customer(i, f"Customer {i}", f"customer{i}@email.com") for i in range(count)]
+
+def build_showroom(size, seed=0):
+    """A showroom with `size` cars, size // 10 customers and a tenth of
+    the cars already sold."""
+    showroom = Showroom()
+    showroom.add_cars(make_cars(size, seed=seed))
+    showroom.add_customers(make_customers(max(1, size // 10)))
+    rng = random.Random(seed)
+    for car_id in rng.sample(range(size), size // 10):
+        showroom.sell_car(car_id, rng.randrange(max(1, size // 10)))
+    return showroom
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+def _time_calls(operation, calls):
+    latencies = []
+    clock = time.perf_counter
+    started = clock()
+    for i in range(calls):
+        t0 = clock()
+        operation(i)
+        latencies.append(clock() - t0)
+    elapsed = clock() - started
+    latencies.sort()
+    return {
+        "calls": calls,
+        "seconds": elapsed,
+        "ops_per_second": calls / elapsed if elapsed else 0.0,
+        "p50_us": _percentile(latencies, 0.50) * 1e6,
+        "p95_us": _percentile(latencies, 0.95) * 1e6,
+        "p99_us": _percentile(latencies, 0.99) * 1e6,
+        "max_us": latencies[-1] * 1e6 if latencies else 0.0,
+    }
+
+def _peak_memory(prepare, size, calls):
+    # A second, traced run: tracemalloc slows allocation down, so it is
+    # kept out of the timed run above.
+    tracemalloc.start()
+    operation, calls = prepare(size, calls)
+    for i in range(calls):
+        operation(i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def measure(prepare, size, calls, memory=True):
+    """Time `calls` calls of the operation built by prepare(size, calls) and
+    optionally record peak traced memory (showroom plus operation)."""
+    operation, calls = prepare(size, calls)
+    result = _time_calls(operation, calls)
+    result["peak_memory_bytes"] = _peak_memory(prepare, size, calls) if memory else None
+    return result
+
+# Each prepare function builds a fresh showroom of the given size and
+# returns (operation, calls); operation(i) performs the i-th call.
+
+def _prepare_add_car(size, calls):
+    showroom = build_showroom(size)
+    cars = make_cars(calls, start_id=size, seed=1)
+    return (lambda i: showroom.add_car(cars[i])), calls
+
+def _prepare_remove_car(size, calls):
+    showroom = build_showroom(size)
+    victims = random.Random(2).sample(range(size), min(calls, size))
+    return (lambda i: showroom.remove_car(victims[i])), len(victims)
+
+def _prepare_sell_car(size, calls):
+    showroom = build_showroom(size)
+    available = [car.car_id for car in showroom.cars if car.is_available]
+    targets = random.Random(3).sample(available, min(calls, len(available)))
+    customers = max(1, size // 10)
+    return (lambda i: showroom.sell_car(targets[i], i % customers)), len(targets)
+
+# Cars per fleet sale: the same fleets are sold one sell_car call per car,
+# and as one all-or-nothing sell_cars call
+FLEET_SIZE = 50
+
+def _fleets(showroom, calls):
+    available = [car.car_id for car in showroom.cars if car.is_available]
+    random.Random(6).shuffle(available)
+    count = min(calls, len(available) // FLEET_SIZE)
+    return [available[i * FLEET_SIZE:(i + 1) * FLEET_SIZE] for i in range(count)]
+
+def _prepare_fleet_per_car(size, calls):
+    showroom = build_showroom(size)
+    fleets = _fleets(showroom, calls)
+
+    def sell_fleet(i):
+        for car_id in fleets[i]:
+            showroom.sell_car(car_id, 0)
+    return sell_fleet, len(fleets)
+
+def _prepare_fleet_batch(size, calls):
+    showroom = build_showroom(size)
+    fleets = _fleets(showroom, calls)
+    return (lambda i: showroom.sell_cars(fleets[i], 0)), len(fleets)
+
+def _prepare_price_range(size, calls):
+    showroom = build_showroom(size)
+    rng = random.Random(4)
+    bounds = [(low, low + 2000) for low in (rng.randint(10, 88) * 1000 for _ in range(calls))]
+    return (lambda i: showroom.cars_in_price_range(*bounds[i])), calls
+
+def _prepare_get_cars_display(size, calls):
+    showroom = build_showroom(size)
+    return (lambda i: showroom.get_cars_display()), calls
+
+def _prepare_cars_page(size, calls):
+    showroom = build_showroom(size)
+    rng = random.Random(5)
+    offsets = [rng.randrange(size) for _ in range(calls)]
+    return (lambda i: showroom.get_cars_display(offsets[i], 50)), calls
+
+def _prepare_get_sales_display(size, calls):
+    showroom = build_showroom(size)
+    return (lambda i: showroom.get_sales_display()), calls
+
+class Skipped(Exception):
+    """The benchmark cannot run here (the GUI ones need Tk and a display)."""
+
+_root = None
+
+def _tk_root():
+    global _root
+    if _root is None:
+        try:
+            import tkinter
+        except ImportError as e:
+            raise Skipped(f"tkinter is not installed ({e})") from None
+        try:
+            _root = tkinter.Tk()
+        except tkinter.TclError as e:
+            raise Skipped(f"no display ({e})") from None
+    # Drop the grid of the previous benchmark
+    for child in _root.winfo_children():
+        child.destroy()
+    return _root
+
+# Rows the grid benchmarks show at once
+GRID_HEIGHT = 40
+
+def _prepare_grid_refresh(grid_class, size, calls):
+    """Scroll a cars grid to random positions, redrawing every row in
+    view each time, and let Tk repaint."""
+    from gui_grid import CAR_COLUMNS, car_rows
+    root = _tk_root()
+    showroom = build_showroom(size)
+    grid = grid_class(root, CAR_COLUMNS, showroom.car_count,
+                      lambda offset, limit: car_rows(showroom, offset, limit), height=GRID_HEIGHT)
+    grid.frame.pack()
+    grid.refresh()
+    root.update()
+    rng = random.Random(7)
+    tops = [rng.randrange(max(1, size - GRID_HEIGHT)) for _ in range(calls)]
+
+    def refresh(i):
+        grid.top = tops[i]
+        grid.refresh()
+        root.update_idletasks()
+    return refresh, calls
+
+def _prepare_text_refresh(size, calls):
+    """The cars tab before VirtualGrid: the whole list rendered into a
+    Text widget, then a second pass over its lines adding an availability
+    tag (and configuring it) per line, as refresh_cars used to."""
+    import tkinter as tk
+    root = _tk_root()
+    showroom = build_showroom(size)
+    text = tk.Text(root, height=GRID_HEIGHT)
+    text.pack()
+    root.update()
+
+    def refresh(i):
+        text.delete(1.0, tk.END)
+        cars_display = showroom.get_cars_display()
+        text.insert(tk.END, cars_display)
+        for row, line in enumerate(cars_display.split('\n'), 1):
+            if "Available" in line:
+                text.tag_add("available", f"{row}.0", f"{row}.{len(line)}")
+                text.tag_config("available", foreground="green")
+            elif "Sold" in line:
+                text.tag_add("sold", f"{row}.0", f"{row}.{len(line)}")
+                text.tag_config("sold", foreground="red")
+        root.update_idletasks()
+    return refresh, calls
+
+def _prepare_grid_per_row(size, calls):
+    import tkinter as tk
+    from gui_grid import VirtualGrid
+
+    class PerRowGrid(VirtualGrid):
+        # VirtualGrid._render as it was before the window went to Tcl in
+        # one call: an item (or insert) call per row
+        def _render(self):
+            tree = self.tree
+            shown = 0
+            for values, tag in self.rows(self.top, self._visible):
+                tags = (tag,) if tag else ()
+                if shown < len(self._items):
+                    tree.item(self._items[shown], values=values, tags=tags)
+                    self._keys[shown] = values[0]
+                else:
+                    self._items.append(tree.insert("", tk.END, values=values, tags=tags))
+                    self._keys.append(values[0])
+                shown += 1
+            if shown < len(self._items):
+                tree.delete(*self._items[shown:])
+                del self._items[shown:]
+                del self._keys[shown:]
+            self._show_position()
+    return _prepare_grid_refresh(PerRowGrid, size, calls)
+
+def _prepare_grid_batched(size, calls):
+    from gui_grid import VirtualGrid
+    return _prepare_grid_refresh(VirtualGrid, size, calls)
+
+# name -> (prepare function, calls, largest size it is run at)
+BENCHMARKS = {
+    "add_car": (_prepare_add_car, 10000, None),
+    "remove_car": (_prepare_remove_car, 10000, None),
+    "sell_car": (_prepare_sell_car, 10000, None),
+    "fleet_sale_per_car": (_prepare_fleet_per_car, 200, None),
+    "fleet_sale_batch": (_prepare_fleet_batch, 200, None),
+    "cars_in_price_range": (_prepare_price_range, 1000, None),
+    "cars_page": (_prepare_cars_page, 1000, None),
+    # Whole-inventory renderers are O(n) per call, so fewer calls and a cap
+    "get_cars_display": (_prepare_get_cars_display, 3, 10 ** 6),
+    "get_sales_display": (_prepare_get_sales_display, 3, 10 ** 6),
+    # Refreshing the GUI cars table: before (text_refresh_tagged, the whole
+    # list in a Text widget, O(n) per refresh) and after (grid_refresh_batched,
+    # only the rows in view, one Tcl call). grid_refresh_per_row draws the
+    # same window with one Tcl call per row, so against grid_refresh_batched
+    # it only compares Tcl round trips per window; neither depends on size.
+    "text_refresh_tagged": (_prepare_text_refresh, 3, 10 ** 6),
+    "grid_refresh_per_row": (_prepare_grid_per_row, 1000, None),
+    "grid_refresh_batched": (_prepare_grid_batched, 1000, None),
+}
+
+def run(sizes, names=None, repeat_scale=1.0, memory=True):
+    results = []
+    for name in names or BENCHMARKS:
+        prepare, calls, max_size = BENCHMARKS[name]
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            try:
+                result = measure(prepare, size, max(1, int(calls * repeat_scale)), memory)
+            except Skipped as e:
+                print(f"{name:>22} skipped: {e}", flush=True)
+                break
+            result.update(operation=name, size=size)
+            results.append(result)
+            peak = "" if result["peak_memory_bytes"] is None else f"  peak {result['peak_memory_bytes'] / 2 ** 20:>8.1f} MiB"
+            print(f"{name:>22} n={size:<9} {result['ops_per_second']:>12,.0f} ops/s  "
+                  f"p50 {result['p50_us']:>9.1f}us  p99 {result['p99_us']:>9.1f}us{peak}", flush=True)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark core Showroom operations and the GUI cars table at increasing sizes.")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma-separated showroom sizes (e.g. 1000,10000,100000,1000000,10000000)")
+    parser.add_argument("--only", help="comma-separated benchmark names: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the number of calls per benchmark")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run that records peak memory")
+    parser.add_argument("--json", help="write results to this file for comparing releases")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    names = args.only.split(",") if args.only else None
+    results = run(sizes, names, args.scale, memory=not args.no_memory)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "timestamp": time.time(),
+                "results": results,
+            }, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.json}")
+
+if __name__ == "__main__":
+    main()
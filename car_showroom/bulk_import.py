@@ -0,0 +1,160 @@
+import argparse
+import csv
+import json
+import math
+import time
+from itertools import islice
+from car_showroom import Car, Customer, Showroom
+
+def read_rows(path):
+    """Yield one record per row from a .csv (with a header row) or .jsonl
+    file, reading the file lazily: a dict for CSV, the line itself for
+    JSONL. Lines are decoded with the rest of a row's checks (see
+    _decode), so one malformed line is counted as invalid instead of
+    ending the import."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield line
+        else:
+            yield from csv.DictReader(f)
+
+def _decode(row):
+    if isinstance(row, str):
+        row = json.loads(row)
+        if not isinstance(row, dict):
+            raise TypeError(f"expected a JSON object, not {type(row).__name__}")
+    return row
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _string(row, name):
+    # str() would turn a JSON null into "None"
+    value = row[name]
+    if not isinstance(value, str):
+        raise TypeError(f"{name} must be a string, not {type(value).__name__}")
+    return value.strip()
+
+def _integer(row, name):
+    # int() would turn true into 1 and truncate 2.9 to 2
+    value = row[name]
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise TypeError(f"{name} must be an integer, not {type(value).__name__}")
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{name} must be an integer, not {value}")
+    return int(value)
+
+def _number(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise TypeError(f"price must be a number, not {type(value).__name__}")
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            value = float(value)
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("price must be a finite number")
+    return value
+
+def parse_car(row):
+    brand = _string(row, "brand")
+    model = _string(row, "model")
+    if not brand or not model:
+        raise ValueError("brand and model cannot be empty")
+    image_path = _string(row, "image_path") if row.get("image_path") is not None else None
+    return Car(_integer(row, "car_id"), brand, model, _integer(row, "year"), _number(row["price"]), image_path or None)
+
+def parse_customer(row):
+    name = _string(row, "name")
+    contact = _string(row, "contact")
+    if not name or not contact:
+        raise ValueError("name and contact cannot be empty")
+    return Customer(_integer(row, "customer_id"), name, contact)
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.seconds = 0.0
+        # (row number, message) for the first few invalid rows
+        self.errors = []
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"{self.rows} rows in {self.seconds:.2f}s ({self.rows_per_second:,.0f} rows/s): "
+                f"{self.imported} imported, {self.invalid} invalid, {self.duplicates} duplicate IDs")
+
+def _import(add_many, parse, rows, batch_size, max_errors):
+    report = ImportReport()
+    start = time.perf_counter()
+    for batch in batched(rows, batch_size):
+        items = []
+        for row in batch:
+            report.rows += 1
+            try:
+                items.append(parse(_decode(row)))
+            except (KeyError, TypeError, ValueError, OverflowError) as e:
+                report.invalid += 1
+                if len(report.errors) < max_errors:
+                    report.errors.append((report.rows, f"{type(e).__name__}: {e}"))
+        added = add_many(items)
+        report.imported += added
+        report.duplicates += len(items) - added
+    report.seconds = time.perf_counter() - start
+    return report
+
+def import_cars(showroom, path, batch_size=10000, max_errors=20):
+    """Stream cars from a CSV/JSONL file into showroom in batches, using
+    showroom.add_cars so indexes are updated once per batch. Invalid rows
+    are counted and skipped. Returns an ImportReport."""
+    return _import(showroom.add_cars, parse_car, read_rows(path), batch_size, max_errors)
+
+def import_customers(showroom, path, batch_size=10000, max_errors=20):
+    """Like import_cars, for customers."""
+    return _import(showroom.add_customers, parse_customer, read_rows(path), batch_size, max_errors)
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import cars or customers from a CSV or JSONL feed.")
+    parser.add_argument("kind", choices=["cars", "customers"])
+    parser.add_argument("path", help="CSV file with a header row, or a .jsonl file")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--db", help="SQLite database to import into")
+    target.add_argument("--journal", help="journal directory to import into")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    # Without a target the feed is only validated
+    if args.db:
+        from sqlite_backend import SQLiteShowroom
+        showroom = SQLiteShowroom(args.db)
+    elif args.journal:
+        from journal import open_showroom
+        showroom = open_showroom(args.journal)
+    else:
+        showroom = Showroom()
+
+    importer = import_cars if args.kind == "cars" else import_customers
+    report = importer(showroom, args.path, batch_size=args.batch_size)
+    print(report)
+    for row_number, message in report.errors:
+        print(f"  row {row_number}: {message}")
+
+    if args.db:
+        showroom.close()
+    elif args.journal:
+        showroom.journal.close()
+
+if __name__ == "__main__":
+    main()
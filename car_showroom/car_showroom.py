@@ -1,188 +1,778 @@
-1class Car:
-    def __init__(self, car_id, brand, model, year, price):
-        self.car_id = car_id
-        self.brand = brand
-        self.model = model
-        self.year = year
-        self.price = price
-        self.is_available = True
-
-    def __str__(self):
-        return f"{self.car_id} - {self.brand} {self.model} ({self.year}) - ${self.price}"
-
-class Customer:
-    def __init__(self, customer_id, name, contact):
-        self.customer_id = customer_id
-        self.name = name
-        self.contact = contact
-
-    def __str__(self):
-        return f"{self.customer_id} - {self.name} - {self.contact}"
-
-class Showroom:
-    def __init__(self):
-        self.cars = []
-        self.customers = []
-        self.sales = []
-
-    def add_car(self, car):
-        self.cars.append(car)
-        print(f"Car '{car}' added to showroom.")
-
-    def remove_car(self, car_id):
-        for car in self.cars:
-            if car.car_id == car_id:
-                self.cars.remove(car)
-                print(f"Car with ID {car_id} removed from showroom.")
-                return
-        print(f"Car with ID {car_id} not found.")
-
-    def display_cars(self):
-        if not self.cars:
-            print("No cars available in showroom.")
-            return
-        
-        print("\n--- Available Cars ---")
-        for car in self.cars:
-            status = "Available" if car.is_available else "Sold"
-            print(f"{car} - {status}")
-
-    def add_customer(self, customer):
-        self.customers.append(customer)
-        print(f"Customer '{customer}' added to records.")
-
-    def display_customers(self):
-        if not self.customers:
-            print("No customers registered.")
-            return
-            
-        print("\n--- Registered Customers ---")
-        for customer in self.customers:
-            print(customer)
-
-    def sell_car(self, car_id, customer_id):
-        # Find the car
-        car = None
-        for c in self.cars:
-            if c.car_id == car_id:
-                car = c
-                break
-        
-        if not car:
-            print(f"Car with ID {car_id} not found.")
-            return
-            
-        if not car.is_available:
-            print(f"Car with ID {car_id} is already sold.")
-            return
-
-        # Find the customer
-        customer = None
-        for c in self.customers:
-            if c.customer_id == customer_id:
-                customer = c
-                break
-        
-        if not customer:
-            print(f"Customer with ID {customer_id} not found.")
-            return
-
-        # Process sale
-        car.is_available = False
-        sale_record = {
-            'car': car,
-            'customer': customer
-        }
-        self.sales.append(sale_record)
-        print(f"Car '{car}' sold to '{customer}'")
-
-    def display_sales(self):
-        if not self.sales:
-            print("No sales recorded yet.")
-            return
-            
-        print("\n--- Sales Records ---")
-        for i, sale in enumerate(self.sales, 1):
-            print(f"{i}. {sale['car']} sold to {sale['customer']}")
-
-def main():
-    showroom = Showroom()
-    
-    # Adding some sample data
-    showroom.add_car(Car(1, "Toyota", "Camry", 2022, 25000))
-    showroom.add_car(Car(2, "Honda", "Civic", 2021, 22000))
-    showroom.add_car(Car(3, "Ford", "Mustang", 2023, 35000))
-    
-    showroom.add_customer(Customer(1, "John Doe", "john@email.com"))
-    showroom.add_customer(Customer(2, "Jane Smith", "jane@email.com"))
-    
-    while True:
-        print("\n=== Car Showroom Management System ===")
-        print("1. Display Cars")
-        print("2. Add Car")
-        print("3. Remove Car")
-        print("4. Display Customers")
-        print("5. Add Customer")
-        print("6. Sell Car")
-        print("7. Display Sales")
-        print("8. Exit")
-        
-        choice = input("Enter your choice (1-8): ")
-        
-        if choice == '1':
-            showroom.display_cars()
-            
-        elif choice == '2':
-            try:
-                car_id = int(input("Enter Car ID: "))
-                brand = input("Enter Brand: ")
-                model = input("Enter Model: ")
-                year = int(input("Enter Year: "))
-                price = float(input("Enter Price: "))
-                
-                car = Car(car_id, brand, model, year, price)
-                showroom.add_car(car)
-            except ValueError:
-                print("Invalid input. Please enter valid data types.")
-                
-        elif choice == '3':
-            try:
-                car_id = int(input("Enter Car ID to remove: "))
-                showroom.remove_car(car_id)
-            except ValueError:
-                print("Invalid input. Please enter a valid Car ID.")
-                
-        elif choice == '4':
-            showroom.display_customers()
-            
-        elif choice == '5':
-            try:
-                customer_id = int(input("Enter Customer ID: "))
-                name = input("Enter Name: ")
-                contact = input("Enter Contact: ")
-                
-                customer = Customer(customer_id, name, contact)
-                showroom.add_customer(customer)
-            except ValueError:
-                print("Invalid input. Please enter valid data types.")
-                
-        elif choice == '6':
-            try:
-                car_id = int(input("Enter Car ID to sell: "))
-                customer_id = int(input("Enter Customer ID: "))
-                showroom.sell_car(car_id, customer_id)
-            except ValueError:
-                print("Invalid input. Please enter valid IDs.")
-                
-        elif choice == '7':
-            showroom.display_sales()
-            
-        elif choice == '8':
-            print("Thank you for using Car Showroom Management System!")
-            break
-            
-        else:
-            print("Invalid choice. Please enter a number between 1-8.")
-
-if __name__ == "__main__":
+import heapq
+import sys
+import time
+from datetime import datetime
+from sales_timeseries import SalesTimeSeries
+from sorted_index import SortedIds, SortedIndex
+from trigram_index import TrigramIndex
+
+class Car:
+    def __init__(self, car_id, brand, model, year, price, image_path=None):
+        self.car_id = car_id
+        self.brand = brand
+        self.model = model
+        self.year = year
+        self.price = price
+        self.is_available = True
+        self.image_path = image_path
+
+    def __str__(self):
+        return f"{self.car_id} - {self.brand} {self.model} ({self.year}) - ${self.price}"
+
+class Customer:
+    def __init__(self, customer_id, name, contact):
+        self.customer_id = customer_id
+        self.name = name
+        self.contact = contact
+
+    def __str__(self):
+        return f"{self.customer_id} - {self.name} - {self.contact}"
+
+# How long reserve_car holds a car by default, and at most
+RESERVATION_HOURS = 48
+MAX_RESERVATION_HOURS = 7 * 24
+
+def _format_time(timestamp):
+    return f"{datetime.fromtimestamp(timestamp):%Y-%m-%d %H:%M}"
+
+def _hold_expiry(hours, expires_at=None):
+    """When a hold for `hours` from now (or until expires_at) runs out, and
+    that time formatted. Raises ValueError for hours out of range or a time
+    that cannot be shown, before anything is stored."""
+    if expires_at is None:
+        if not 0 < hours <= MAX_RESERVATION_HOURS:
+            raise ValueError(f"hours must be more than 0 and at most {MAX_RESERVATION_HOURS}")
+        expires_at = time.time() + hours * 3600
+    try:
+        return expires_at, _format_time(expires_at)
+    except (OverflowError, OSError, ValueError):
+        raise ValueError(f"Cannot hold a car until {expires_at}")
+
+def _check_batch_cars(car_ids, customer_id, get_car, get_reservation):
+    """Check every car of a fleet sale, given lookups of a car and of its
+    hold by ID. Returns (cars in the order given, error)."""
+    cars = {}
+    for car_id in car_ids:
+        car = get_car(car_id)
+        if not car:
+            return None, f"Car with ID {car_id} not found."
+        if not car.is_available:
+            return None, f"Car with ID {car_id} is already sold."
+        if car_id in cars:
+            return None, f"Car with ID {car_id} is listed more than once."
+        hold = get_reservation(car_id)
+        if hold is not None and hold[0] != customer_id:
+            return None, f"Car with ID {car_id} is reserved until {_format_time(hold[1])}."
+        cars[car_id] = car
+    if not cars:
+        return None, "No cars to sell."
+    return list(cars.values()), None
+
+def _car_search_text(car):
+    return f"{car.brand} {car.model}"
+
+def _customer_search_keys(customer):
+    name = " ".join(customer.name.split()).casefold()
+    words = name.split(" ")
+    keys = {name, customer.contact.strip().casefold()}
+    for i in range(1, len(words)):
+        keys.add(" ".join(words[i:]))
+    return keys
+
+class Showroom:
+    def __init__(self, car_store=None, journal=None):
+        # Cars and customers are indexed by ID so lookups, sales and
+        # removals are O(1); dicts keep insertion order for display.
+        # car_store can replace the car dict with any mapping keyed by
+        # car_id, e.g. columnar_store.ColumnarCarStore for large inventories.
+        self._cars_by_id = {} if car_store is None else car_store
+        self._customers_by_id = {}
+        self.sales = []
+        # Sale counts and revenue by day, week and month
+        self._sales_timeseries = SalesTimeSeries()
+        # IDs in ascending order, for paging through cars and customers
+        self._car_ids = SortedIds()
+        self._customer_ids = SortedIds()
+        # Case-folded customer names, surnames and contacts, for prefix search
+        self._customer_search_index = SortedIndex()
+        # "Brand Model" of every car, for typo-tolerant search
+        self._car_search_index = TrigramIndex()
+        # Available cars only, so range queries never have to skip sold units
+        self._price_index = SortedIndex()
+        self._year_index = SortedIndex()
+        # car_id -> (customer_id, expires_at) for cars on hold, and a min-heap
+        # of (expires_at, car_id) so expired holds are found without a scan.
+        # Heap entries of holds that were extended, released or sold are
+        # left in place and skipped when they come up.
+        self._reservations = {}
+        self._reservation_heap = []
+        # Optional journal.ShowroomJournal that records every change
+        self.journal = journal
+        # Callbacks told about each change once it is made; see subscribe()
+        self._listeners = []
+        # Running totals for get_stats(), updated on every change
+        self._available_count = 0
+        self._inventory_value = 0
+        self._revenue = 0
+        self._available_by_brand = {}
+
+    @property
+    def cars(self):
+        return self._cars_by_id.values()
+
+    @property
+    def customers(self):
+        return self._customers_by_id.values()
+
+    def car_count(self):
+        return len(self._cars_by_id)
+
+    def customer_count(self):
+        return len(self._customers_by_id)
+
+    def get_car(self, car_id):
+        return self._cars_by_id.get(car_id)
+
+    def get_customer(self, customer_id):
+        return self._customers_by_id.get(customer_id)
+
+    def add_car(self, car):
+        if car.car_id in self._cars_by_id:
+            return False
+        self._cars_by_id[car.car_id] = car
+        self._car_ids.add(car.car_id)
+        self._car_search_index.add(car.car_id, _car_search_text(car))
+        if car.is_available:
+            self._index_available_car(car)
+        self._log("add_car", car=car)
+        self._notify("add_car", car=car)
+        return True
+
+    def add_cars(self, cars):
+        """Add many cars at once, updating the range indexes in bulk. Cars
+        whose ID is already taken are skipped. Returns the number added."""
+        added = []
+        for car in cars:
+            if car.car_id in self._cars_by_id:
+                continue
+            self._cars_by_id[car.car_id] = car
+            added.append(car)
+            self._log("add_car", car=car)
+        self._car_ids.add_many(car.car_id for car in added)
+        for car in added:
+            self._car_search_index.add(car.car_id, _car_search_text(car))
+        available = [car for car in added if car.is_available]
+        self._price_index.add_many((car.price, car.car_id) for car in available)
+        self._year_index.add_many((car.year, car.car_id) for car in available)
+        for car in available:
+            self._count_available(car, 1)
+        if added:
+            self._notify("add_cars", cars=added)
+        return len(added)
+
+    def remove_car(self, car_id):
+        car = self._cars_by_id.pop(car_id, None)
+        if car is None:
+            return False
+        self._car_ids.remove(car_id)
+        self._car_search_index.remove(car_id, _car_search_text(car))
+        if car.is_available:
+            self._unindex_available_car(car)
+        self._reservations.pop(car_id, None)
+        self._log("remove_car", car_id=car_id)
+        self._notify("remove_car", car=car)
+        return True
+
+    def _log(self, op, **data):
+        if self.journal is not None:
+            self.journal.record(self, op, **data)
+
+    def subscribe(self, listener):
+        """Call listener(change, **data) after every change, so views can
+        update just what changed instead of re-reading everything. The
+        changes are add_car(car), add_cars(cars), remove_car(car),
+        add_customer(customer), add_customers(customers), sell_car(car,
+        customer), sell_cars(cars, customer), reserve_car(car),
+        release_reservation(car), and reset() when the whole state was
+        replaced. Returns a function that unsubscribes the listener."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self, change, **data):
+        for listener in self._listeners:
+            listener(change, **data)
+
+    def car_index(self, car_id):
+        """Position of the car in ID order (where it would be if absent)."""
+        return self._car_ids.index(car_id)
+
+    def customer_index(self, customer_id):
+        """Position of the customer in ID order."""
+        return self._customer_ids.index(customer_id)
+
+    def _index_available_car(self, car):
+        self._price_index.add(car.price, car.car_id)
+        self._year_index.add(car.year, car.car_id)
+        self._count_available(car, 1)
+
+    def _unindex_available_car(self, car):
+        self._price_index.remove(car.price, car.car_id)
+        self._year_index.remove(car.year, car.car_id)
+        self._count_available(car, -1)
+
+    def _count_available(self, car, delta):
+        self._available_count += delta
+        self._inventory_value += delta * car.price
+        brand_count = self._available_by_brand.get(car.brand, 0) + delta
+        if brand_count:
+            self._available_by_brand[car.brand] = brand_count
+        else:
+            del self._available_by_brand[car.brand]
+
+    def get_stats(self):
+        """Dashboard figures, read from running totals rather than by
+        scanning cars or sales."""
+        total_cars = len(self._cars_by_id)
+        return {
+            'total_cars': total_cars,
+            'available_cars': self._available_count,
+            'sold_cars': total_cars - self._available_count,
+            'customers': len(self._customers_by_id),
+            'sales': len(self.sales),
+            'reserved_cars': self.reserved_count(),
+            'inventory_value': self._inventory_value,
+            'revenue': self._revenue,
+            'available_by_brand': dict(self._available_by_brand),
+        }
+
+    def cars_in_price_range(self, min_price=None, max_price=None):
+        """Available cars priced between min_price and max_price (inclusive),
+        cheapest first."""
+        return [self._cars_by_id[car_id] for car_id in self._price_index.range(min_price, max_price)]
+
+    def cars_in_year_range(self, start_year=None, end_year=None):
+        """Available cars with a model year between start_year and end_year
+        (inclusive), oldest first."""
+        return [self._cars_by_id[car_id] for car_id in self._year_index.range(start_year, end_year)]
+
+    # Paging: each iter_* method yields one page lazily, ordered by ID
+    # (sales by sale number). offset and limit select by position; after_id
+    # starts just past a given ID instead (keyset paging, so the next page
+    # of a live inventory stays right when cars are added or removed ahead
+    # of it). Both cost O(log n + limit), whatever the page number.
+
+    def iter_cars(self, offset=0, limit=None, after_id=None):
+        cars = self._cars_by_id
+        for car_id in self._car_ids.page(offset, limit, after_id):
+            yield cars[car_id]
+
+    def car_status(self, car):
+        """"Available", "Sold" or "Reserved until <time>"."""
+        if not car.is_available:
+            return "Sold"
+        hold = self.get_reservation(car.car_id)
+        if hold is not None:
+            return f"Reserved until {_format_time(hold[1])}"
+        return "Available"
+
+    def iter_cars_display(self, offset=0, limit=None, after_id=None):
+        for car in self.iter_cars(offset, limit, after_id):
+            yield f"{car} - {self.car_status(car)}"
+
+    def get_cars_display(self, offset=0, limit=None, after_id=None):
+        if not self.car_count():
+            return "No cars available in showroom."
+        lines = ["Available Cars:"]
+        lines.extend(self.iter_cars_display(offset, limit, after_id))
+        return "\n".join(lines) + "\n"
+
+    def display_cars(self, offset=0, limit=None, after_id=None):
+        if not self.car_count():
+            print("No cars available in showroom.")
+            return
+        
+        print("\n--- Available Cars ---")
+        for line in self.iter_cars_display(offset, limit, after_id):
+            print(line)
+
+    def add_customer(self, customer):
+        if customer.customer_id in self._customers_by_id:
+            return False
+        self._customers_by_id[customer.customer_id] = customer
+        self._customer_ids.add(customer.customer_id)
+        for key in _customer_search_keys(customer):
+            self._customer_search_index.add(key, customer.customer_id)
+        self._log("add_customer", customer=customer)
+        self._notify("add_customer", customer=customer)
+        return True
+
+    def add_customers(self, customers):
+        """Add many customers at once, updating the indexes in bulk and
+        skipping taken IDs. Returns the number added."""
+        added = []
+        for customer in customers:
+            if customer.customer_id in self._customers_by_id:
+                continue
+            self._customers_by_id[customer.customer_id] = customer
+            added.append(customer)
+            self._log("add_customer", customer=customer)
+        self._customer_ids.add_many(customer.customer_id for customer in added)
+        self._customer_search_index.add_many(
+            (key, customer.customer_id) for customer in added for key in _customer_search_keys(customer))
+        if added:
+            self._notify("add_customers", customers=added)
+        return len(added)
+
+    def search_cars(self, query, limit=10, available_only=False):
+        """Cars whose brand and model best match query, tolerating typos
+        ("Mercedez", "Mustng"), best match first. Words are compared by
+        trigram similarity, so order and case do not matter."""
+        found = []
+        if limit <= 0:
+            return found
+        for car_id, _ in self._car_search_index.search(query):
+            car = self._cars_by_id[car_id]
+            if available_only and not car.is_available:
+                continue
+            found.append(car)
+            if len(found) == limit:
+                break
+        return found
+
+    def search_customers(self, prefix, limit=10):
+        """Customers whose name, any later word of the name (so surnames
+        match too) or contact starts with prefix, ignoring case. At most
+        `limit` are returned, ordered by the matching text."""
+        prefix = " ".join(prefix.split()).casefold()
+        if not prefix:
+            return []
+        found = {}
+        for customer_id in self._customer_search_index.prefix(prefix):
+            found[customer_id] = None
+            if len(found) == limit:
+                break
+        return [self._customers_by_id[customer_id] for customer_id in found]
+
+    def iter_customers(self, offset=0, limit=None, after_id=None):
+        customers = self._customers_by_id
+        for customer_id in self._customer_ids.page(offset, limit, after_id):
+            yield customers[customer_id]
+
+    def iter_customers_display(self, offset=0, limit=None, after_id=None):
+        for customer in self.iter_customers(offset, limit, after_id):
+            yield str(customer)
+
+    def get_customers_display(self, offset=0, limit=None, after_id=None):
+        if not self.customer_count():
+            return "No customers registered."
+        lines = ["Registered Customers:"]
+        lines.extend(self.iter_customers_display(offset, limit, after_id))
+        return "\n".join(lines) + "\n"
+
+    def display_customers(self, offset=0, limit=None, after_id=None):
+        if not self.customer_count():
+            print("No customers registered.")
+            return
+            
+        print("\n--- Registered Customers ---")
+        for line in self.iter_customers_display(offset, limit, after_id):
+            print(line)
+
+    def sell_car(self, car_id, customer_id, sold_at=None):
+        """Sell a car; sold_at (seconds since the epoch) defaults to now and
+        is only given when replaying a sale that was made earlier."""
+        car, customer, error = self._check_sale(car_id, customer_id)
+        if error:
+            return error
+
+        self._complete_sale(car, customer, sold_at)
+        return f"Car '{car}' sold to '{customer}'"
+
+    def _check_sale(self, car_id, customer_id):
+        """Look up both sides of a sale; returns (car, customer, error)."""
+        car = self._cars_by_id.get(car_id)
+        if not car:
+            return None, None, f"Car with ID {car_id} not found."
+            
+        if not car.is_available:
+            return None, None, f"Car with ID {car_id} is already sold."
+
+        customer = self._customers_by_id.get(customer_id)
+        if not customer:
+            return None, None, f"Customer with ID {customer_id} not found."
+
+        hold = self.get_reservation(car_id)
+        if hold is not None and hold[0] != customer_id:
+            return None, None, f"Car with ID {car_id} is reserved until {_format_time(hold[1])}."
+        return car, customer, None
+
+    def _complete_sale(self, car, customer, sold_at=None):
+        if sold_at is None:
+            sold_at = time.time()
+        car.is_available = False
+        self._unindex_available_car(car)
+        self._reservations.pop(car.car_id, None)
+        self.restore_sale(car, customer, sold_at)
+        self._log("sell_car", car_id=car.car_id, customer_id=customer.customer_id, sold_at=sold_at)
+        self._notify("sell_car", car=car, customer=customer)
+
+    def sell_cars(self, car_ids, customer_id, sold_at=None):
+        """Sell several cars to one customer (a fleet sale) as a single
+        transaction: every car is checked first, and if any of them cannot
+        be sold, nothing is sold and the error for that car is returned.
+        The sales share one timestamp and one journal record."""
+        cars, customer, error = self._check_batch_sale(car_ids, customer_id)
+        if error:
+            return error
+
+        self._complete_batch_sale(cars, customer, sold_at)
+        return f"{len(cars)} cars sold to '{customer}'"
+
+    def _check_batch_sale(self, car_ids, customer_id):
+        """_check_sale for a whole batch; returns (cars, customer, error)."""
+        customer = self._customers_by_id.get(customer_id)
+        if not customer:
+            return None, None, f"Customer with ID {customer_id} not found."
+
+        cars, error = _check_batch_cars(car_ids, customer_id, self._cars_by_id.get, self.get_reservation)
+        return cars, customer, error
+
+    def _complete_batch_sale(self, cars, customer, sold_at=None):
+        if sold_at is None:
+            sold_at = time.time()
+        for car in cars:
+            car.is_available = False
+            self._unindex_available_car(car)
+            self._reservations.pop(car.car_id, None)
+        # restore_sale for the whole batch, with one rollup update
+        self.sales.extend({'car': car, 'customer': customer, 'sold_at': sold_at, 'price': car.price}
+                          for car in cars)
+        total = sum(car.price for car in cars)
+        self._revenue += total
+        self._sales_timeseries.record(sold_at, total, len(cars))
+        self._log("sell_cars", car_ids=[car.car_id for car in cars],
+                  customer_id=customer.customer_id, sold_at=sold_at)
+        self._notify("sell_cars", cars=cars, customer=customer)
+
+    def restore_sale(self, car, customer, sold_at, price=None):
+        """Record a sale without any checks; sell_car uses it after
+        validating, and loaders use it to bring back saved sales of cars
+        that are already marked sold. price is what the car sold for (its
+        listed price by default)."""
+        if price is None:
+            price = car.price
+        sale_record = {
+            'car': car,
+            'customer': customer,
+            'sold_at': sold_at,
+            'price': price
+        }
+        self.sales.append(sale_record)
+        self._revenue += price
+        self._sales_timeseries.record(sold_at, price)
+
+    def iter_sales(self, offset=0, limit=None):
+        stop = len(self.sales) if limit is None else min(len(self.sales), offset + limit)
+        for i in range(offset, stop):
+            yield self.sales[i]
+
+    def iter_sales_display(self, offset=0, limit=None):
+        for number, sale in enumerate(self.iter_sales(offset, limit), offset + 1):
+            yield f"{number}. {sale['car']} sold to {sale['customer']} on {_format_time(sale['sold_at'])}"
+
+    def get_sales_display(self, offset=0, limit=None):
+        if not self.sales:
+            return "No sales recorded yet."
+        lines = ["Sales Records:"]
+        lines.extend(self.iter_sales_display(offset, limit))
+        return "\n".join(lines) + "\n"
+
+    def display_sales(self, offset=0, limit=None):
+        if not self.sales:
+            print("No sales recorded yet.")
+            return
+            
+        print("\n--- Sales Records ---")
+        for line in self.iter_sales_display(offset, limit):
+            print(line)
+
+    # Reservations hold an available car for one customer until a deadline;
+    # sell_car refuses anyone else meanwhile. Expired holds are dropped
+    # lazily, by popping the heap up to the current time whenever
+    # reservations are looked at, so each hold costs O(log n) to add and
+    # to expire and nothing ever scans all of them.
+
+    def reserve_car(self, car_id, customer_id, hours=RESERVATION_HOURS, expires_at=None):
+        """Hold an available car for a customer for `hours` (or until
+        expires_at, seconds since the epoch, when replaying a saved hold).
+        Reserving a car the same customer already holds extends the hold.
+        Raises ValueError if hours is not in (0, MAX_RESERVATION_HOURS]."""
+        expires_at, until = _hold_expiry(hours, expires_at)
+        car = self._cars_by_id.get(car_id)
+        if not car:
+            return f"Car with ID {car_id} not found."
+
+        if not car.is_available:
+            return f"Car with ID {car_id} is already sold."
+
+        customer = self._customers_by_id.get(customer_id)
+        if not customer:
+            return f"Customer with ID {customer_id} not found."
+
+        hold = self.get_reservation(car_id)
+        if hold is not None and hold[0] != customer_id:
+            return f"Car with ID {car_id} is reserved until {_format_time(hold[1])}."
+
+        self._hold(car_id, customer_id, expires_at)
+        self._log("reserve_car", car_id=car_id, customer_id=customer_id, expires_at=expires_at)
+        self._notify("reserve_car", car=car)
+        return f"Car '{car}' reserved for '{customer}' until {until}"
+
+    def _hold(self, car_id, customer_id, expires_at):
+        self._reservations[car_id] = (customer_id, expires_at)
+        heapq.heappush(self._reservation_heap, (expires_at, car_id))
+        # Rebuild once skipped entries outnumber live holds, so holds that
+        # keep being extended or released early cannot grow the heap
+        if len(self._reservation_heap) > 2 * len(self._reservations) + 64:
+            self._reservation_heap = [(expires, held_id) for held_id, (_, expires) in self._reservations.items()]
+            heapq.heapify(self._reservation_heap)
+
+    def release_reservation(self, car_id):
+        """Drop the hold on a car. Returns False if it had none."""
+        if self.get_reservation(car_id) is None:
+            return False
+        del self._reservations[car_id]
+        self._log("release_reservation", car_id=car_id)
+        self._notify("release_reservation", car=self._cars_by_id[car_id])
+        return True
+
+    def _expire_reservations(self):
+        heap = self._reservation_heap
+        if not heap:
+            return
+        now = time.time()
+        while heap and heap[0][0] <= now:
+            expires_at, car_id = heapq.heappop(heap)
+            hold = self._reservations.get(car_id)
+            if hold is not None and hold[1] == expires_at:
+                del self._reservations[car_id]
+
+    def get_reservation(self, car_id):
+        """(customer_id, expires_at) of the car's current hold, or None."""
+        self._expire_reservations()
+        return self._reservations.get(car_id)
+
+    def reserved_count(self):
+        self._expire_reservations()
+        return len(self._reservations)
+
+    def iter_reservations(self):
+        """(car_id, customer_id, expires_at) for every current hold."""
+        self._expire_reservations()
+        for car_id, (customer_id, expires_at) in list(self._reservations.items()):
+            yield car_id, customer_id, expires_at
+
+    # Period totals come from the rollups, so they cost one lookup per day,
+    # week or month asked about however many sales there are
+
+    def sales_by_period(self, period="day", start=None, end=None):
+        """[(period start date, sales, revenue)] per day, week or month from
+        start to end; see SalesTimeSeries.series."""
+        return self._sales_timeseries.series(period, start, end)
+
+    def sales_between(self, start, end):
+        """(sales, revenue) for the dates start to end inclusive."""
+        return self._sales_timeseries.totals(start, end)
+
+    def sales_this(self, period="week", today=None):
+        """(sales, revenue) so far this day, week or month."""
+        return self._sales_timeseries.current(period, today)
+
+PAGE_SIZE = 20
+
+def show_pages(display, total, page_size=PAGE_SIZE):
+    """Print display(offset, limit) one page at a time, asking before each
+    further page, so only one page is ever formatted."""
+    pages = max(1, -(-total // page_size))
+    page = 1
+    while True:
+        display((page - 1) * page_size, page_size)
+        if pages == 1:
+            return
+        answer = input(f"Page {page} of {pages} - Enter for next, a page number, or q to stop: ").strip()
+        if answer.lower() == 'q':
+            return
+        if answer.isdigit():
+            page = min(max(int(answer), 1), pages)
+        elif page < pages:
+            page += 1
+        else:
+            return
+
+def ask_id(kind, search):
+    """Ask for a car or customer ID. Anything that is not a number is taken
+    as search text: search(text) is listed and the ID is asked for again."""
+    answer = input(f"Enter {kind} ID (or text to search): ").strip()
+    if not answer.isdigit():
+        matches = search(answer)
+        for match in matches:
+            print(f"  {match}")
+        if not matches:
+            print(f"No matching {kind.lower()}s.")
+        answer = input(f"Enter {kind} ID: ")
+    return int(answer)
+
+def main():
+    # Pass a database path (python car_showroom.py showroom.db) to keep
+    # cars, customers and sales between runs.
+    if len(sys.argv) > 1:
+        from sqlite_backend import SQLiteShowroom
+        showroom = SQLiteShowroom(sys.argv[1])
+    else:
+        # In memory: keep the history so operations can be undone
+        from event_store import EventSourcedShowroom
+        showroom = EventSourcedShowroom()
+    from analytics import SalesAnalytics, format_report
+    analytics = SalesAnalytics(showroom)
+    # SHOWROOM_INSTRUMENT=1 prints per-operation latencies on exit
+    from instrumentation import from_environment
+    from_environment(showroom)
+    
+    # Adding some sample data
+    if not showroom.car_count():
+        showroom.add_car(Car(1, "Toyota", "Camry", 2022, 25000))
+        showroom.add_car(Car(2, "Honda", "Civic", 2021, 22000))
+        showroom.add_car(Car(3, "Ford", "Mustang", 2023, 35000))
+        
+        showroom.add_customer(Customer(1, "John Doe", "john@email.com"))
+        showroom.add_customer(Customer(2, "Jane Smith", "jane@email.com"))
+    if hasattr(showroom, "reset_history"):
+        showroom.reset_history()
+    
+    while True:
+        print("\n=== Car Showroom Management System ===")
+        print("1. Display Cars")
+        print("2. Add Car")
+        print("3. Remove Car")
+        print("4. Display Customers")
+        print("5. Add Customer")
+        print("6. Sell Car")
+        print("7. Display Sales")
+        print("8. Sales Analytics")
+        print("9. Reserve Car")
+        print("10. Undo Last Operations")
+        print("11. Display Cars As Of Date")
+        print("12. Exit")
+        
+        choice = input("Enter your choice (1-12): ")
+        
+        if choice == '1':
+            show_pages(showroom.display_cars, showroom.car_count())
+            
+        elif choice == '2':
+            try:
+                car_id = int(input("Enter Car ID: "))
+                brand = input("Enter Brand: ")
+                model = input("Enter Model: ")
+                year = int(input("Enter Year: "))
+                price = float(input("Enter Price: "))
+                
+                car = Car(car_id, brand, model, year, price)
+                if showroom.add_car(car):
+                    print(f"Car '{car}' added to showroom.")
+                else:
+                    print(f"Car with ID {car_id} already exists.")
+            except ValueError:
+                print("Invalid input. Please enter valid data types.")
+                
+        elif choice == '3':
+            try:
+                car_id = int(input("Enter Car ID to remove: "))
+                if showroom.remove_car(car_id):
+                    print(f"Car with ID {car_id} removed from showroom.")
+                else:
+                    print(f"Car with ID {car_id} not found.")
+            except ValueError:
+                print("Invalid input. Please enter a valid Car ID.")
+                
+        elif choice == '4':
+            show_pages(showroom.display_customers, showroom.customer_count())
+            
+        elif choice == '5':
+            try:
+                customer_id = int(input("Enter Customer ID: "))
+                name = input("Enter Name: ")
+                contact = input("Enter Contact: ")
+                
+                customer = Customer(customer_id, name, contact)
+                if showroom.add_customer(customer):
+                    print(f"Customer '{customer}' added to records.")
+                else:
+                    print(f"Customer with ID {customer_id} already exists.")
+            except ValueError:
+                print("Invalid input. Please enter valid data types.")
+                
+        elif choice == '6':
+            try:
+                car_id = ask_id("Car", lambda text: showroom.search_cars(text, available_only=True))
+                customer_id = ask_id("Customer", showroom.search_customers)
+                print(showroom.sell_car(car_id, customer_id))
+            except ValueError:
+                print("Invalid input. Please enter valid IDs.")
+                
+        elif choice == '7':
+            show_pages(showroom.display_sales, len(showroom.sales))
+            
+        elif choice == '8':
+            print()
+            print(format_report(analytics), end="")
+            
+        elif choice == '9':
+            try:
+                car_id = ask_id("Car", lambda text: showroom.search_cars(text, available_only=True))
+                customer_id = ask_id("Customer", showroom.search_customers)
+                hours = input(f"Hold for how many hours? [{RESERVATION_HOURS}]: ").strip()
+                print(showroom.reserve_car(car_id, customer_id, float(hours) if hours else RESERVATION_HOURS))
+            except ValueError:
+                print("Invalid input. Please enter valid IDs and hours.")
+                
+        elif choice == '10':
+            if not hasattr(showroom, "undo"):
+                print("Undo is only available without a database.")
+                continue
+            try:
+                count = input("How many operations to undo? [1]: ").strip()
+                undone = showroom.undo(int(count) if count else 1)
+            except ValueError:
+                print("Invalid input. Please enter a number.")
+                continue
+            if not undone:
+                print("Nothing to undo.")
+            for record in undone:
+                print(f"Undone: {' '.join(map(str, record[:3]))}")
+            analytics.reset()
+                
+        elif choice == '11':
+            if not hasattr(showroom, "as_of"):
+                print("Past inventory is only available without a database.")
+                continue
+            try:
+                when = datetime.strptime(input("Enter date and time (YYYY-MM-DD HH:MM): ").strip(), "%Y-%m-%d %H:%M")
+            except ValueError:
+                print("Invalid input. Please enter a date like 2024-05-31 17:30.")
+                continue
+            past = showroom.as_of(when)
+            print(f"Inventory as of {when:%Y-%m-%d %H:%M}:")
+            show_pages(past.display_cars, past.car_count())
+                
+        elif choice == '12':
+            print("Thank you for using Car Showroom Management System!")
+            if hasattr(showroom, "close"):
+                showroom.close()
+            break
+            
+        else:
+            print("Invalid choice. Please enter a number between 1-12.")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
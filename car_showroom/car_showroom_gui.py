@@ -1,376 +1,321 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
-
-class Car:
-    def __init__(self, car_id, brand, model, year, price):
-        self.car_id = car_id
-        self.brand = brand
-        self.model = model
-        self.year = year
-        self.price = price
-        self.is_available = True
-
-    def __str__(self):
-        return f"{self.car_id} - {self.brand} {self.model} ({self.year}) - ${self.price}"
-
-class Customer:
-    def __init__(self, customer_id, name, contact):
-        self.customer_id = customer_id
-        self.name = name
-        self.contact = contact
-
-    def __str__(self):
-        return f"{self.customer_id} - {self.name} - {self.contact}"
-
-class Showroom:
-    def __init__(self):
-        self.cars = []
-        self.customers = []
-        self.sales = []
-        self.load_sample_data()
-
-    def load_sample_data(self):
-        # Adding some sample data
-        self.add_car(Car(1, "Toyota", "Camry", 2022, 25000))
-        self.add_car(Car(2, "Honda", "Civic", 2021, 22000))
-        self.add_car(Car(3, "Ford", "Mustang", 2023, 35000))
-        
-        self.add_customer(Customer(1, "John Doe", "john@email.com"))
-        self.add_customer(Customer(2, "Jane Smith", "jane@email.com"))
-
-    def add_car(self, car):
-        self.cars.append(car)
-
-    def remove_car(self, car_id):
-        for car in self.cars:
-            if car.car_id == car_id:
-                self.cars.remove(car)
-                return True
-        return False
-
-    def get_cars_display(self):
-        if not self.cars:
-            return "No cars available in showroom."
-        
-        result = "Available Cars:\n"
-        for car in self.cars:
-            status = "Available" if car.is_available else "Sold"
-            result += f"{car} - {status}\n"
-        return result
-
-    def add_customer(self, customer):
-        self.customers.append(customer)
-
-    def get_customers_display(self):
-        if not self.customers:
-            return "No customers registered."
-            
-        result = "Registered Customers:\n"
-        for customer in self.customers:
-            result += f"{customer}\n"
-        return result
-
-    def sell_car(self, car_id, customer_id):
-        # Find the car
-        car = None
-        for c in self.cars:
-            if c.car_id == car_id:
-                car = c
-                break
-        
-        if not car:
-            return f"Car with ID {car_id} not found."
-            
-        if not car.is_available:
-            return f"Car with ID {car_id} is already sold."
-
-        # Find the customer
-        customer = None
-        for c in self.customers:
-            if c.customer_id == customer_id:
-                customer = c
-                break
-        
-        if not customer:
-            return f"Customer with ID {customer_id} not found."
-
-        # Process sale
-        car.is_available = False
-        sale_record = {
-            'car': car,
-            'customer': customer
-        }
-        self.sales.append(sale_record)
-        return f"Car '{car}' sold to '{customer}'"
-
-    def get_sales_display(self):
-        if not self.sales:
-            return "No sales recorded yet."
-            
-        result = "Sales Records:\n"
-        for i, sale in enumerate(self.sales, 1):
-            result += f"{i}. {sale['car']} sold to {sale['customer']}\n"
-        return result
-
-class CarShowroomGUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Car Showroom Management System")
-        self.root.geometry("800x600")
-        self.showroom = Showroom()
-        
-        self.setup_ui()
-
-    def setup_ui(self):
-        # Create notebook for tabs
-        self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Create tabs
-        self.create_cars_tab()
-        self.create_customers_tab()
-        self.create_sales_tab()
-        self.create_add_car_tab()
-        self.create_add_customer_tab()
-        self.create_sell_car_tab()
-
-    def create_cars_tab(self):
-        cars_frame = ttk.Frame(self.notebook)
-        self.notebook.add(cars_frame, text="View Cars")
-        
-        # Title
-        title_label = ttk.Label(cars_frame, text="Cars in Showroom", font=("Arial", 16, "bold"))
-        title_label.pack(pady=10)
-        
-        # Display area
-        self.cars_text = tk.Text(cars_frame, height=20, width=80)
-        scrollbar = ttk.Scrollbar(cars_frame, orient=tk.VERTICAL, command=self.cars_text.yview)
-        self.cars_text.configure(yscrollcommand=scrollbar.set)
-        
-        self.cars_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 10), pady=10)
-        
-        # Refresh button
-        refresh_btn = ttk.Button(cars_frame, text="Refresh", command=self.refresh_cars)
-        refresh_btn.pack(pady=10)
-        
-        # Initial display
-        self.refresh_cars()
-
-    def refresh_cars(self):
-        self.cars_text.delete(1.0, tk.END)
-        self.cars_text.insert(tk.END, self.showroom.get_cars_display())
-
-    def create_customers_tab(self):
-        customers_frame = ttk.Frame(self.notebook)
-        self.notebook.add(customers_frame, text="View Customers")
-        
-        # Title
-        title_label = ttk.Label(customers_frame, text="Registered Customers", font=("Arial", 16, "bold"))
-        title_label.pack(pady=10)
-        
-        # Display area
-        self.customers_text = tk.Text(customers_frame, height=20, width=80)
-        scrollbar = ttk.Scrollbar(customers_frame, orient=tk.VERTICAL, command=self.customers_text.yview)
-        self.customers_text.configure(yscrollcommand=scrollbar.set)
-        
-        self.customers_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 10), pady=10)
-        
-        # Refresh button
-        refresh_btn = ttk.Button(customers_frame, text="Refresh", command=self.refresh_customers)
-        refresh_btn.pack(pady=10)
-        
-        # Initial display
-        self.refresh_customers()
-
-    def refresh_customers(self):
-        self.customers_text.delete(1.0, tk.END)
-        self.customers_text.insert(tk.END, self.showroom.get_customers_display())
-
-    def create_sales_tab(self):
-        sales_frame = ttk.Frame(self.notebook)
-        self.notebook.add(sales_frame, text="View Sales")
-        
-        # Title
-        title_label = ttk.Label(sales_frame, text="Sales Records", font=("Arial", 16, "bold"))
-        title_label.pack(pady=10)
-        
-        # Display area
-        self.sales_text = tk.Text(sales_frame, height=20, width=80)
-        scrollbar = ttk.Scrollbar(sales_frame, orient=tk.VERTICAL, command=self.sales_text.yview)
-        self.sales_text.configure(yscrollcommand=scrollbar.set)
-        
-        self.sales_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 10), pady=10)
-        
-        # Refresh button
-        refresh_btn = ttk.Button(sales_frame, text="Refresh", command=self.refresh_sales)
-        refresh_btn.pack(pady=10)
-        
-        # Initial display
-        self.refresh_sales()
-
-    def refresh_sales(self):
-        self.sales_text.delete(1.0, tk.END)
-        self.sales_text.insert(tk.END, self.showroom.get_sales_display())
-
-    def create_add_car_tab(self):
-        add_car_frame = ttk.Frame(self.notebook)
-        self.notebook.add(add_car_frame, text="Add Car")
-        
-        # Title
-        title_label = ttk.Label(add_car_frame, text="Add New Car", font=("Arial", 16, "bold"))
-        title_label.grid(row=0, column=0, columnspan=2, pady=10)
-        
-        # Form fields
-        ttk.Label(add_car_frame, text="Car ID:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
-        self.car_id_entry = ttk.Entry(add_car_frame)
-        self.car_id_entry.grid(row=1, column=1, padx=10, pady=5)
-        
-        ttk.Label(add_car_frame, text="Brand:").grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
-        self.brand_entry = ttk.Entry(add_car_frame)
-        self.brand_entry.grid(row=2, column=1, padx=10, pady=5)
-        
-        ttk.Label(add_car_frame, text="Model:").grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
-        self.model_entry = ttk.Entry(add_car_frame)
-        self.model_entry.grid(row=3, column=1, padx=10, pady=5)
-        
-        ttk.Label(add_car_frame, text="Year:").grid(row=4, column=0, sticky=tk.W, padx=10, pady=5)
-        self.year_entry = ttk.Entry(add_car_frame)
-        self.year_entry.grid(row=4, column=1, padx=10, pady=5)
-        
-        ttk.Label(add_car_frame, text="Price:").grid(row=5, column=0, sticky=tk.W, padx=10, pady=5)
-        self.price_entry = ttk.Entry(add_car_frame)
-        self.price_entry.grid(row=5, column=1, padx=10, pady=5)
-        
-        # Add button
-        add_btn = ttk.Button(add_car_frame, text="Add Car", command=self.add_car)
-        add_btn.grid(row=6, column=0, columnspan=2, pady=20)
-
-    def add_car(self):
-        try:
-            car_id = int(self.car_id_entry.get())
-            brand = self.brand_entry.get()
-            model = self.model_entry.get()
-            year = int(self.year_entry.get())
-            price = float(self.price_entry.get())
-            
-            if not brand or not model:
-                messagebox.showerror("Error", "Brand and Model cannot be empty!")
-                return
-                
-            car = Car(car_id, brand, model, year, price)
-            self.showroom.add_car(car)
-            messagebox.showinfo("Success", f"Car '{car}' added to showroom.")
-            
-            # Clear entries
-            self.car_id_entry.delete(0, tk.END)
-            self.brand_entry.delete(0, tk.END)
-            self.model_entry.delete(0, tk.END)
-            self.year_entry.delete(0, tk.END)
-            self.price_entry.delete(0, tk.END)
-            
-            # Refresh displays
-            self.refresh_cars()
-            
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid data types!")
-
-    def create_add_customer_tab(self):
-        add_customer_frame = ttk.Frame(self.notebook)
-        self.notebook.add(add_customer_frame, text="Add Customer")
-        
-        # Title
-        title_label = ttk.Label(add_customer_frame, text="Add New Customer", font=("Arial", 16, "bold"))
-        title_label.grid(row=0, column=0, columnspan=2, pady=10)
-        
-        # Form fields
-        ttk.Label(add_customer_frame, text="Customer ID:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
-        self.customer_id_entry = ttk.Entry(add_customer_frame)
-        self.customer_id_entry.grid(row=1, column=1, padx=10, pady=5)
-        
-        ttk.Label(add_customer_frame, text="Name:").grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
-        self.customer_name_entry = ttk.Entry(add_customer_frame)
-        self.customer_name_entry.grid(row=2, column=1, padx=10, pady=5)
-        
-        ttk.Label(add_customer_frame, text="Contact:").grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
-        self.customer_contact_entry = ttk.Entry(add_customer_frame)
-        self.customer_contact_entry.grid(row=3, column=1, padx=10, pady=5)
-        
-        # Add button
-        add_btn = ttk.Button(add_customer_frame, text="Add Customer", command=self.add_customer)
-        add_btn.grid(row=4, column=0, columnspan=2, pady=20)
-
-    def add_customer(self):
-        try:
-            customer_id = int(self.customer_id_entry.get())
-            name = self.customer_name_entry.get()
-            contact = self.customer_contact_entry.get()
-            
-            if not name or not contact:
-                messagebox.showerror("Error", "Name and Contact cannot be empty!")
-                return
-                
-            customer = Customer(customer_id, name, contact)
-            self.showroom.add_customer(customer)
-            messagebox.showinfo("Success", f"Customer '{customer}' added to records.")
-            
-            # Clear entries
-            self.customer_id_entry.delete(0, tk.END)
-            self.customer_name_entry.delete(0, tk.END)
-            self.customer_contact_entry.delete(0, tk.END)
-            
-            # Refresh displays
-            self.refresh_customers()
-            
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid Customer ID!")
-
-    def create_sell_car_tab(self):
-        sell_car_frame = ttk.Frame(self.notebook)
-        self.notebook.add(sell_car_frame, text="Sell Car")
-        
-        # Title
-        title_label = ttk.Label(sell_car_frame, text="Sell Car to Customer", font=("Arial", 16, "bold"))
-        title_label.grid(row=0, column=0, columnspan=2, pady=10)
-        
-        # Form fields
-        ttk.Label(sell_car_frame, text="Car ID:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
-        self.sell_car_id_entry = ttk.Entry(sell_car_frame)
-        self.sell_car_id_entry.grid(row=1, column=1, padx=10, pady=5)
-        
-        ttk.Label(sell_car_frame, text="Customer ID:").grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
-        self.sell_customer_id_entry = ttk.Entry(sell_car_frame)
-        self.sell_customer_id_entry.grid(row=2, column=1, padx=10, pady=5)
-        
-        # Sell button
-        sell_btn = ttk.Button(sell_car_frame, text="Sell Car", command=self.sell_car)
-        sell_btn.grid(row=3, column=0, columnspan=2, pady=20)
-
-    def sell_car(self):
-        try:
-            car_id = int(self.sell_car_id_entry.get())
-            customer_id = int(self.sell_customer_id_entry.get())
-            
-            result = self.showroom.sell_car(car_id, customer_id)
-            messagebox.showinfo("Result", result)
-            
-            # Clear entries
-            self.sell_car_id_entry.delete(0, tk.END)
-            self.sell_customer_id_entry.delete(0, tk.END)
-            
-            # Refresh displays
-            self.refresh_cars()
-            self.refresh_sales()
-            
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid IDs!")
-
-def main():
-    root = tk.Tk()
-    app = CarShowroomGUI(root)
-    root.mainloop()
-
-if __name__ == "__main__":
+import tkinter as tk
+from tkinter import ttk, messagebox
+from analytics import SalesAnalytics
+from car_showroom import RESERVATION_HOURS, Car, Customer, Showroom as BaseShowroom
+from gui_actions import ShowroomActions
+from gui_grid import CAR_COLUMNS, CUSTOMER_COLUMNS, SALE_COLUMNS, VirtualGrid, apply_change, car_rows, customer_rows, sale_rows
+from gui_search import SearchBox
+from instrumentation import from_environment
+
+class Showroom(BaseShowroom):
+    def __init__(self):
+        super().__init__()
+        self.load_sample_data()
+
+    def load_sample_data(self):
+        # Adding some sample data
+        self.add_car(Car(1, "Toyota", "Camry", 2022, 25000))
+        self.add_car(Car(2, "Honda", "Civic", 2021, 22000))
+        self.add_car(Car(3, "Ford", "Mustang", 2023, 35000))
+        
+        self.add_customer(Customer(1, "John Doe", "john@email.com"))
+        self.add_customer(Customer(2, "Jane Smith", "jane@email.com"))
+
+class CarShowroomGUI(ShowroomActions):
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Car Showroom Management System")
+        self.root.geometry("800x600")
+        self.showroom = Showroom()
+        # SHOWROOM_INSTRUMENT=1 times showroom calls and these handlers
+        self.analytics = SalesAnalytics(self.showroom)
+        self.instrumentation = from_environment(self.showroom, self, ["refresh_cars", "refresh_customers", "refresh_sales", "refresh_analytics", "add_car", "add_customer", "sell_car", "reserve_car", "release_reservation", "on_showroom_change"])
+        
+        self.setup_ui()
+        # Views follow showroom changes row by row instead of being rebuilt
+        self.showroom.subscribe(self.on_showroom_change)
+
+    def setup_ui(self):
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Create tabs
+        self.create_cars_tab()
+        self.create_customers_tab()
+        self.create_sales_tab()
+        self.create_analytics_tab()
+        self.create_add_car_tab()
+        self.create_add_customer_tab()
+        self.create_sell_car_tab()
+
+    def on_showroom_change(self, change, **data):
+        apply_change(self.showroom, change, data, self.cars_grid, self.customers_grid, self.sales_grid)
+        if change == "reset":
+            # An undo may have taken sales back
+            self.analytics.reset()
+        if change in ("sell_car", "sell_cars", "reset"):
+            self.mark_analytics_stale()
+
+    def create_cars_tab(self):
+        cars_frame = ttk.Frame(self.notebook)
+        self.notebook.add(cars_frame, text="View Cars")
+        
+        # Title
+        title_label = ttk.Label(cars_frame, text="Cars in Showroom", font=("Arial", 16, "bold"))
+        title_label.pack(pady=10)
+        
+        # Grid: only the rows in view are fetched and drawn
+        self.cars_grid = VirtualGrid(
+            cars_frame, CAR_COLUMNS, self.showroom.car_count,
+            lambda offset, limit: car_rows(self.showroom, offset, limit), themed=True)
+        self.cars_grid.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Refresh button
+        refresh_btn = ttk.Button(cars_frame, text="Refresh", command=self.refresh_cars)
+        refresh_btn.pack(pady=10)
+        
+        # Initial display
+        self.refresh_cars()
+
+    def refresh_cars(self):
+        self.cars_grid.refresh()
+
+    def create_customers_tab(self):
+        customers_frame = ttk.Frame(self.notebook)
+        self.notebook.add(customers_frame, text="View Customers")
+        
+        # Title
+        title_label = ttk.Label(customers_frame, text="Registered Customers", font=("Arial", 16, "bold"))
+        title_label.pack(pady=10)
+        
+        # Grid: only the rows in view are fetched and drawn
+        self.customers_grid = VirtualGrid(
+            customers_frame, CUSTOMER_COLUMNS, self.showroom.customer_count,
+            lambda offset, limit: customer_rows(self.showroom, offset, limit), themed=True)
+        self.customers_grid.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Refresh button
+        refresh_btn = ttk.Button(customers_frame, text="Refresh", command=self.refresh_customers)
+        refresh_btn.pack(pady=10)
+        
+        # Initial display
+        self.refresh_customers()
+
+    def refresh_customers(self):
+        self.customers_grid.refresh()
+
+    def create_sales_tab(self):
+        sales_frame = ttk.Frame(self.notebook)
+        self.notebook.add(sales_frame, text="View Sales")
+        
+        # Title
+        title_label = ttk.Label(sales_frame, text="Sales Records", font=("Arial", 16, "bold"))
+        title_label.pack(pady=10)
+        
+        # Grid: only the rows in view are fetched and drawn
+        self.sales_grid = VirtualGrid(
+            sales_frame, SALE_COLUMNS, lambda: len(self.showroom.sales),
+            lambda offset, limit: sale_rows(self.showroom, offset, limit), themed=True)
+        self.sales_grid.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Refresh button
+        refresh_btn = ttk.Button(sales_frame, text="Refresh", command=self.refresh_sales)
+        refresh_btn.pack(pady=10)
+        
+        # Initial display
+        self.refresh_sales()
+
+    def refresh_sales(self):
+        self.sales_grid.refresh()
+
+    def create_analytics_tab(self):
+        analytics_frame = ttk.Frame(self.notebook)
+        self.notebook.add(analytics_frame, text="Analytics")
+        
+        # Title
+        title_label = ttk.Label(analytics_frame, text="Sales Analytics", font=("Arial", 16, "bold"))
+        title_label.pack(pady=10)
+        
+        # Display area (fixed width font so the report columns line up)
+        self.analytics_text = tk.Text(analytics_frame, height=20, width=80, font=("Courier", 10))
+        scrollbar = ttk.Scrollbar(analytics_frame, orient=tk.VERTICAL, command=self.analytics_text.yview)
+        self.analytics_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.analytics_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 10), pady=10)
+        
+        # Refresh button
+        refresh_btn = ttk.Button(analytics_frame, text="Refresh", command=self.refresh_analytics)
+        refresh_btn.pack(pady=10)
+        
+        self.watch_analytics_tab(analytics_frame)
+
+    def create_add_car_tab(self):
+        add_car_frame = ttk.Frame(self.notebook)
+        self.notebook.add(add_car_frame, text="Add Car")
+        
+        # Title
+        title_label = ttk.Label(add_car_frame, text="Add New Car", font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=10)
+        
+        # Form fields
+        ttk.Label(add_car_frame, text="Car ID:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
+        self.car_id_entry = ttk.Entry(add_car_frame)
+        self.car_id_entry.grid(row=1, column=1, padx=10, pady=5)
+        
+        ttk.Label(add_car_frame, text="Brand:").grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
+        self.brand_entry = ttk.Entry(add_car_frame)
+        self.brand_entry.grid(row=2, column=1, padx=10, pady=5)
+        
+        ttk.Label(add_car_frame, text="Model:").grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
+        self.model_entry = ttk.Entry(add_car_frame)
+        self.model_entry.grid(row=3, column=1, padx=10, pady=5)
+        
+        ttk.Label(add_car_frame, text="Year:").grid(row=4, column=0, sticky=tk.W, padx=10, pady=5)
+        self.year_entry = ttk.Entry(add_car_frame)
+        self.year_entry.grid(row=4, column=1, padx=10, pady=5)
+        
+        ttk.Label(add_car_frame, text="Price:").grid(row=5, column=0, sticky=tk.W, padx=10, pady=5)
+        self.price_entry = ttk.Entry(add_car_frame)
+        self.price_entry.grid(row=5, column=1, padx=10, pady=5)
+        
+        # Add button
+        add_btn = ttk.Button(add_car_frame, text="Add Car", command=self.add_car)
+        add_btn.grid(row=6, column=0, columnspan=2, pady=20)
+
+    def add_car(self):
+        try:
+            car_id = int(self.car_id_entry.get())
+            brand = self.brand_entry.get()
+            model = self.model_entry.get()
+            year = int(self.year_entry.get())
+            price = float(self.price_entry.get())
+            
+            if not brand or not model:
+                messagebox.showerror("Error", "Brand and Model cannot be empty!")
+                return
+                
+            car = Car(car_id, brand, model, year, price)
+            if not self.showroom.add_car(car):
+                messagebox.showerror("Error", f"Car with ID {car_id} already exists!")
+                return
+            messagebox.showinfo("Success", f"Car '{car}' added to showroom.")
+            
+            # Clear entries
+            self.car_id_entry.delete(0, tk.END)
+            self.brand_entry.delete(0, tk.END)
+            self.model_entry.delete(0, tk.END)
+            self.year_entry.delete(0, tk.END)
+            self.price_entry.delete(0, tk.END)
+            
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid data types!")
+
+    def create_add_customer_tab(self):
+        add_customer_frame = ttk.Frame(self.notebook)
+        self.notebook.add(add_customer_frame, text="Add Customer")
+        
+        # Title
+        title_label = ttk.Label(add_customer_frame, text="Add New Customer", font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=10)
+        
+        # Form fields
+        ttk.Label(add_customer_frame, text="Customer ID:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
+        self.customer_id_entry = ttk.Entry(add_customer_frame)
+        self.customer_id_entry.grid(row=1, column=1, padx=10, pady=5)
+        
+        ttk.Label(add_customer_frame, text="Name:").grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
+        self.customer_name_entry = ttk.Entry(add_customer_frame)
+        self.customer_name_entry.grid(row=2, column=1, padx=10, pady=5)
+        
+        ttk.Label(add_customer_frame, text="Contact:").grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
+        self.customer_contact_entry = ttk.Entry(add_customer_frame)
+        self.customer_contact_entry.grid(row=3, column=1, padx=10, pady=5)
+        
+        # Add button
+        add_btn = ttk.Button(add_customer_frame, text="Add Customer", command=self.add_customer)
+        add_btn.grid(row=4, column=0, columnspan=2, pady=20)
+
+    def add_customer(self):
+        try:
+            customer_id = int(self.customer_id_entry.get())
+            name = self.customer_name_entry.get()
+            contact = self.customer_contact_entry.get()
+            
+            if not name or not contact:
+                messagebox.showerror("Error", "Name and Contact cannot be empty!")
+                return
+                
+            customer = Customer(customer_id, name, contact)
+            if not self.showroom.add_customer(customer):
+                messagebox.showerror("Error", f"Customer with ID {customer_id} already exists!")
+                return
+            messagebox.showinfo("Success", f"Customer '{customer}' added to records.")
+            
+            # Clear entries
+            self.customer_id_entry.delete(0, tk.END)
+            self.customer_name_entry.delete(0, tk.END)
+            self.customer_contact_entry.delete(0, tk.END)
+            
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid Customer ID!")
+
+    def create_sell_car_tab(self):
+        sell_car_frame = ttk.Frame(self.notebook)
+        self.notebook.add(sell_car_frame, text="Sell Car")
+        
+        # Title
+        title_label = ttk.Label(sell_car_frame, text="Sell Car to Customer", font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=10)
+        
+        # Form fields
+        ttk.Label(sell_car_frame, text="Car ID:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
+        self.sell_car_id_entry = ttk.Entry(sell_car_frame)
+        self.sell_car_id_entry.grid(row=1, column=1, padx=10, pady=5)
+        
+        # Car search: pick an available car by (misspelt) brand or model
+        ttk.Label(sell_car_frame, text="Find Car:").grid(row=2, column=0, sticky=tk.NW, padx=10, pady=5)
+        self.car_search = SearchBox(sell_car_frame, self.find_cars, self.pick_car, themed=True)
+        self.car_search.frame.grid(row=2, column=1, sticky=tk.EW, padx=10, pady=5)
+        
+        ttk.Label(sell_car_frame, text="Customer ID:").grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
+        self.sell_customer_id_entry = ttk.Entry(sell_car_frame)
+        self.sell_customer_id_entry.grid(row=3, column=1, padx=10, pady=5)
+        
+        # Customer search: pick a match to fill in the Customer ID
+        ttk.Label(sell_car_frame, text="Find Customer:").grid(row=4, column=0, sticky=tk.NW, padx=10, pady=5)
+        self.customer_search = SearchBox(sell_car_frame, self.find_customers, self.pick_customer, themed=True)
+        self.customer_search.frame.grid(row=4, column=1, sticky=tk.EW, padx=10, pady=5)
+        
+        # Sell, or hold the car for the customer for RESERVATION_HOURS
+        button_frame = ttk.Frame(sell_car_frame)
+        button_frame.grid(row=5, column=0, columnspan=2, pady=20)
+        ttk.Button(button_frame, text="Sell Car", command=self.sell_car).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text=f"Reserve ({RESERVATION_HOURS}h)", command=self.reserve_car).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Release Hold", command=self.release_reservation).pack(side=tk.LEFT, padx=5)
+
+    def sell_car(self):
+        try:
+            car_id = int(self.sell_car_id_entry.get())
+            customer_id = int(self.sell_customer_id_entry.get())
+            
+            result = self.showroom.sell_car(car_id, customer_id)
+            messagebox.showinfo("Result", result)
+            
+            # Clear entries
+            self.sell_car_id_entry.delete(0, tk.END)
+            self.sell_customer_id_entry.delete(0, tk.END)
+            self.car_search.clear()
+            self.customer_search.clear()
+            
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid IDs!")
+
+def main():
+    root = tk.Tk()
+    app = CarShowroomGUI(root)
+    root.mainloop()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,202 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping, ValuesView
+
+# Bits in the per-row flags column
+_AVAILABLE = 1
+_REMOVED = 2
+_INT_PRICE = 4
+
+class CarView:
+    """A car stored in a ColumnarCarStore. Reads and writes go straight to the
+    store's columns, so a view costs two slots instead of a full __dict__."""
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    @property
+    def car_id(self):
+        return self._store._ids[self._row]
+
+    @property
+    def brand(self):
+        return self._store._strings[self._store._brands[self._row]]
+
+    @property
+    def model(self):
+        return self._store._strings[self._store._models[self._row]]
+
+    @property
+    def year(self):
+        return self._store._years[self._row]
+
+    @property
+    def price(self):
+        price = self._store._prices[self._row]
+        if self._store._flags[self._row] & _INT_PRICE:
+            return int(price)
+        return price
+
+    @property
+    def image_path(self):
+        return self._store._strings[self._store._images[self._row]]
+
+    @property
+    def is_available(self):
+        return bool(self._store._flags[self._row] & _AVAILABLE)
+
+    @is_available.setter
+    def is_available(self, value):
+        if value:
+            self._store._flags[self._row] |= _AVAILABLE
+        else:
+            self._store._flags[self._row] &= ~_AVAILABLE
+
+    def __eq__(self, other):
+        if isinstance(other, CarView):
+            return self._store is other._store and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._store), self._row))
+
+    def __str__(self):
+        return f"{self.car_id} - {self.brand} {self.model} ({self.year}) - ${self.price}"
+
+class _ColumnarValues(ValuesView):
+    def __iter__(self):
+        store = self._mapping
+        flags = store._flags
+        for row in range(len(flags)):
+            if not flags[row] & _REMOVED:
+                yield CarView(store, row)
+
+class ColumnarCarStore(MutableMapping):
+    """Car storage for Showroom that keeps each attribute in a typed array
+    (or an interned string code) instead of one Python object per car.
+
+    Pass an instance as Showroom(car_store=ColumnarCarStore()). Lookups return
+    CarView objects. Rows are append-only: removing a car only flags its row,
+    so views held elsewhere (for example in sales records) stay valid.
+
+    While cars arrive in increasing car_id order (the usual case for feeds and
+    generated IDs) lookups binary-search the id column and no per-car Python
+    objects are kept at all. The first out-of-order insert switches to a
+    car_id -> row dict, trading memory for O(1) lookups.
+
+    The columns take about 32 bytes per car, but Showroom's price and year
+    indexes still keep a (key, car_id) tuple per available car, so a whole
+    showroom of 100,000 cars comes to about 270 bytes per car, against
+    about 430 with the default dict store.
+    """
+
+    def __init__(self):
+        self._ids = array('q')
+        self._years = array('h')
+        self._prices = array('d')
+        self._brands = array('I')
+        self._models = array('I')
+        self._images = array('I')
+        self._flags = bytearray()
+        self._count = 0
+        self._row_by_id = None
+        # Interned strings; code 0 is None (cars without an image)
+        self._strings = [None]
+        self._string_codes = {None: 0}
+
+    def _intern(self, value):
+        code = self._string_codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._string_codes[value] = code
+        return code
+
+    def _row_flags(self, car):
+        flags = _AVAILABLE if car.is_available else 0
+        if isinstance(car.price, int):
+            flags |= _INT_PRICE
+        return flags
+
+    def _row_values(self, car):
+        # Every value is converted before any column changes, so a value
+        # that does not fit its column (a year outside array('h'), a price
+        # that is not a number) raises with the columns still lined up
+        return (array('h', [car.year])[0], array('d', [car.price])[0], self._intern(car.brand),
+                self._intern(car.model), self._intern(car.image_path), self._row_flags(car))
+
+    def _find_row(self, car_id):
+        if self._row_by_id is not None:
+            return self._row_by_id.get(car_id)
+        try:
+            row = bisect_left(self._ids, car_id)
+        except TypeError:
+            # An ID that cannot be compared with the int IDs is not here
+            return None
+        if row < len(self._ids) and self._ids[row] == car_id and not self._flags[row] & _REMOVED:
+            return row
+        return None
+
+    def _build_row_dict(self):
+        ids = self._ids
+        flags = self._flags
+        self._row_by_id = {ids[row]: row for row in range(len(ids)) if not flags[row] & _REMOVED}
+
+    def __getitem__(self, car_id):
+        row = self._find_row(car_id)
+        if row is None:
+            raise KeyError(car_id)
+        return CarView(self, row)
+
+    def __setitem__(self, car_id, car):
+        row = self._find_row(car_id)
+        year, price, brand, model, image, flags = self._row_values(car)
+        if row is None:
+            car_id = array('q', [car_id])[0]
+            if self._row_by_id is None and self._ids and car_id <= self._ids[-1]:
+                self._build_row_dict()
+            if self._row_by_id is not None:
+                self._row_by_id[car_id] = len(self._ids)
+            self._count += 1
+            self._ids.append(car_id)
+            self._years.append(year)
+            self._prices.append(price)
+            self._brands.append(brand)
+            self._models.append(model)
+            self._images.append(image)
+            self._flags.append(flags)
+        else:
+            self._years[row] = year
+            self._prices[row] = price
+            self._brands[row] = brand
+            self._models[row] = model
+            self._images[row] = image
+            self._flags[row] = flags
+
+    def __delitem__(self, car_id):
+        row = self._find_row(car_id)
+        if row is None:
+            raise KeyError(car_id)
+        if self._row_by_id is not None:
+            del self._row_by_id[car_id]
+        self._flags[row] |= _REMOVED
+        self._count -= 1
+
+    def __iter__(self):
+        ids = self._ids
+        flags = self._flags
+        for row in range(len(flags)):
+            if not flags[row] & _REMOVED:
+                yield ids[row]
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, car_id):
+        return self._find_row(car_id) is not None
+
+    def values(self):
+        return _ColumnarValues(self)
@@ -0,0 +1,221 @@
+import random
+import sys
+import threading
+import time
+from contextlib import ExitStack
+from car_showroom import RESERVATION_HOURS, Car, Customer, Showroom
+
+class ConcurrentShowroom(Showroom):
+    """Showroom that can be shared by several threads (e.g. one per sales
+    terminal).
+
+    Each car ID maps to one of `stripes` locks. A sale holds its car's stripe
+    lock from the availability check until the car is marked sold, so the
+    same car can never be sold twice, while sales of cars on other stripes
+    only meet on a short critical section that updates the shared indexes,
+    totals and journal.
+    """
+
+    def __init__(self, car_store=None, journal=None, stripes=64):
+        super().__init__(car_store=car_store, journal=journal)
+        self._car_locks = [threading.Lock() for _ in range(stripes)]
+        # Guards the ID dicts, range indexes, running totals, sales list and
+        # journal. Always taken after a car lock, never before.
+        self._state_lock = threading.RLock()
+
+    def _car_lock(self, car_id):
+        return self._car_locks[hash(car_id) % len(self._car_locks)]
+
+    @property
+    def cars(self):
+        # A copy, so callers can iterate while other threads add or remove
+        with self._state_lock:
+            return list(self._cars_by_id.values())
+
+    @property
+    def customers(self):
+        with self._state_lock:
+            return list(self._customers_by_id.values())
+
+    def car_count(self):
+        with self._state_lock:
+            return super().car_count()
+
+    def customer_count(self):
+        with self._state_lock:
+            return super().customer_count()
+
+    # Pages are read under the lock and handed back as a finished list, so a
+    # removal on another thread cannot break an iteration half way through
+
+    def iter_cars(self, offset=0, limit=None, after_id=None):
+        with self._state_lock:
+            return iter(list(super().iter_cars(offset, limit, after_id)))
+
+    def iter_customers(self, offset=0, limit=None, after_id=None):
+        with self._state_lock:
+            return iter(list(super().iter_customers(offset, limit, after_id)))
+
+    def iter_sales(self, offset=0, limit=None):
+        with self._state_lock:
+            return iter(list(super().iter_sales(offset, limit)))
+
+    def add_car(self, car):
+        with self._state_lock:
+            return super().add_car(car)
+
+    def add_cars(self, cars):
+        with self._state_lock:
+            return super().add_cars(cars)
+
+    def remove_car(self, car_id):
+        with self._car_lock(car_id), self._state_lock:
+            return super().remove_car(car_id)
+
+    def add_customer(self, customer):
+        with self._state_lock:
+            return super().add_customer(customer)
+
+    def add_customers(self, customers):
+        with self._state_lock:
+            return super().add_customers(customers)
+
+    def sell_car(self, car_id, customer_id, sold_at=None):
+        with self._car_lock(car_id):
+            car, customer, error = self._check_sale(car_id, customer_id)
+            if error:
+                return error
+            with self._state_lock:
+                self._complete_sale(car, customer, sold_at)
+        return f"Car '{car}' sold to '{customer}'"
+
+    def sell_cars(self, car_ids, customer_id, sold_at=None):
+        car_ids = list(car_ids)
+        # Stripes are always taken in ascending order, so two fleet sales
+        # that share stripes cannot deadlock
+        stripes = sorted({hash(car_id) % len(self._car_locks) for car_id in car_ids})
+        with ExitStack() as held:
+            for stripe in stripes:
+                held.enter_context(self._car_locks[stripe])
+            cars, customer, error = self._check_batch_sale(car_ids, customer_id)
+            if error:
+                return error
+            with self._state_lock:
+                self._complete_batch_sale(cars, customer, sold_at)
+        return f"{len(cars)} cars sold to '{customer}'"
+
+    def reserve_car(self, car_id, customer_id, hours=RESERVATION_HOURS, expires_at=None):
+        with self._car_lock(car_id), self._state_lock:
+            return super().reserve_car(car_id, customer_id, hours, expires_at)
+
+    def release_reservation(self, car_id):
+        with self._car_lock(car_id), self._state_lock:
+            return super().release_reservation(car_id)
+
+    def _expire_reservations(self):
+        # Also reached from sell_car's checks, which hold only the car lock
+        with self._state_lock:
+            super()._expire_reservations()
+
+    def iter_reservations(self):
+        with self._state_lock:
+            return iter(list(super().iter_reservations()))
+
+    def cars_in_price_range(self, min_price=None, max_price=None):
+        with self._state_lock:
+            return super().cars_in_price_range(min_price, max_price)
+
+    def cars_in_year_range(self, start_year=None, end_year=None):
+        with self._state_lock:
+            return super().cars_in_year_range(start_year, end_year)
+
+    def search_cars(self, query, limit=10, available_only=False):
+        with self._state_lock:
+            return super().search_cars(query, limit, available_only)
+
+    def search_customers(self, prefix, limit=10):
+        with self._state_lock:
+            return super().search_customers(prefix, limit)
+
+    def sales_by_period(self, period="day", start=None, end=None):
+        with self._state_lock:
+            return super().sales_by_period(period, start, end)
+
+    def sales_between(self, start, end):
+        with self._state_lock:
+            return super().sales_between(start, end)
+
+    def sales_this(self, period="week", today=None):
+        with self._state_lock:
+            return super().sales_this(period, today)
+
+    def get_stats(self):
+        with self._state_lock:
+            return super().get_stats()
+
+def _with_race_window(showroom_class):
+    """showroom_class with a thread switch between a sale's availability
+    check and marking the car sold, the window in which two unlocked
+    sales of the same car can both pass the check."""
+    class RacingShowroom(showroom_class):
+        def _check_sale(self, car_id, customer_id):
+            checked = super()._check_sale(car_id, customer_id)
+            time.sleep(0)
+            return checked
+
+    RacingShowroom.__name__ = showroom_class.__name__
+    return RacingShowroom
+
+def stress_test(showroom_class=ConcurrentShowroom, cars=2000, customers=50, threads=16, attempts=20000):
+    """Have many threads try to sell a small pool of cars at once and
+    check that no car was sold twice. Returns the number of double sales.
+    Every sale yields to other threads between its check and its
+    completion, so a showroom without locking (plain Showroom) does sell
+    cars twice."""
+    showroom = _with_race_window(showroom_class)()
+    showroom.add_cars(Car(i, "Brand", "Model", 2020, 20000 + i) for i in range(cars))
+    showroom.add_customers(Customer(i, f"Customer {i}", f"c{i}@email.com") for i in range(customers))
+    start_barrier = threading.Barrier(threads)
+    # An unlocked showroom can also break its indexes half way through a
+    # sale; the clerk that hits it stops and the error is counted
+    errors = []
+
+    def clerk(seed):
+        rng = random.Random(seed)
+        start_barrier.wait()
+        for _ in range(attempts // threads):
+            try:
+                showroom.sell_car(rng.randrange(cars), rng.randrange(customers))
+            except Exception as e:
+                errors.append(e)
+                return
+
+    # Switch threads as often as possible to widen any race window
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        workers = [threading.Thread(target=clerk, args=(seed,)) for seed in range(threads)]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        sys.setswitchinterval(old_interval)
+
+    sold_ids = [sale['car'].car_id for sale in showroom.sales]
+    double_sales = len(sold_ids) - len(set(sold_ids))
+    stats = showroom.get_stats()
+    print(f"{showroom_class.__name__}: {len(sold_ids)} sales by {threads} threads in {elapsed:.2f}s, "
+          f"{double_sales} double sales, {len(errors)} clerks stopped by errors")
+    if not double_sales:
+        # A showroom that sold no car twice must also agree with itself
+        assert not errors, errors
+        assert stats['sold_cars'] == len(set(sold_ids))
+        assert stats['sales'] == len(sold_ids)
+    return double_sales
+
+if __name__ == "__main__":
+    assert stress_test(Showroom) > 0, "the race window is too narrow to catch an unlocked showroom"
+    assert stress_test() == 0
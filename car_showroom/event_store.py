@@ -0,0 +1,142 @@
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from car_showroom import Showroom
+from journal import _apply_record, _encode_record, _load_rows, _snapshot_rows
+
+class EventSourcedShowroom(Showroom):
+    """A Showroom that keeps every change as an immutable event, so the
+    last operations can be undone and the inventory can be looked at as it
+    was at any earlier time.
+
+    Events are the journal's records (one per add_car / add_customer /
+    remove_car / sell_car / sell_cars / reserve_car / release_reservation)
+    with the time they were made. The state is a fold over them: each
+    operation event points at the one it was made on top of, and undo(n)
+    appends an undo event that moves the head n operations back rather
+    than deleting anything, so as_of() still sees the undone operations at
+    the times they were in effect.
+
+    Every so often the state at the head is kept as a checkpoint (the rows
+    of a journal snapshot). Any state is rebuilt from its nearest
+    checkpointed ancestor plus the events since, so undo() and as_of() cost
+    O(checkpoint + delta). As in ShowroomJournal, a checkpoint is only
+    taken once the events since the last one outnumber the cars and
+    customers, which keeps checkpoints amortized O(1) per event and their
+    memory in proportion to the history.
+
+    The history lives in memory and starts from the state the showroom
+    had when reset_history() was last called (empty when created); call
+    it after loading saved data, e.g. with journal.open_showroom(), so the
+    load itself cannot be undone. Cars are kept in a plain dict, since
+    undo rebuilds the state from scratch.
+    """
+
+    def __init__(self, journal=None, checkpoint_every=1000):
+        super().__init__(journal=journal)
+        self.checkpoint_every = checkpoint_every
+        self._replaying = False
+        self.reset_history()
+
+    def reset_history(self):
+        """Forget every event and make the current state the starting
+        point that undo() and as_of() go back to."""
+        # Per event, by sequence number: its record, its time (never
+        # decreasing, for bisecting), the operation it was made on top of
+        # (None for undo events) and the head after it
+        self._records = []
+        self._times = []
+        self._parents = []
+        self._heads = []
+        # Head operation (None for the starting state) -> checkpoint rows
+        self._checkpoints = {None: list(_snapshot_rows(self))}
+        self._head = None
+        self._since_checkpoint = 0
+
+    def _log(self, op, **data):
+        if self._replaying:
+            return
+        super()._log(op, **data)
+        seq = len(self._records)
+        self._append(_encode_record(op, data), self._head, seq)
+        self._head = seq
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= max(self.checkpoint_every, self.car_count() + self.customer_count()):
+            self._checkpoints[seq] = list(_snapshot_rows(self))
+            self._since_checkpoint = 0
+
+    def _append(self, record, parent, head):
+        now = time.time()
+        if self._times and now < self._times[-1]:
+            now = self._times[-1]
+        self._records.append(record)
+        self._times.append(now)
+        self._parents.append(parent)
+        self._heads.append(head)
+
+    def _path_from_checkpoint(self, head):
+        """The nearest checkpointed ancestor of head, and the operations
+        from it up to head, oldest first."""
+        path = []
+        while head not in self._checkpoints:
+            path.append(head)
+            head = self._parents[head]
+        path.reverse()
+        return head, path
+
+    def _build(self, showroom, checkpoint, path):
+        _load_rows(showroom, self._checkpoints[checkpoint])
+        for seq in path:
+            _apply_record(showroom, self._records[seq])
+        return showroom
+
+    def history(self, limit=None):
+        """(time, record) for the most recent events, newest first. Records
+        are journal rows such as ["sell_car", car_id, customer_id, sold_at];
+        an undo shows as ["undo", n]."""
+        stop = 0 if limit is None else max(0, len(self._records) - limit)
+        for seq in range(len(self._records) - 1, stop - 1, -1):
+            yield self._times[seq], self._records[seq]
+
+    def undo(self, n=1):
+        """Take back the last n operations (fewer if there are not that
+        many). Returns their records, most recent first."""
+        undone = []
+        head = self._head
+        while len(undone) < n and head is not None:
+            undone.append(self._records[head])
+            head = self._parents[head]
+        if not undone:
+            return undone
+        self._append(["undo", len(undone)], None, head)
+        self._head = head
+
+        checkpoint, path = self._path_from_checkpoint(head)
+        journal, listeners = self.journal, self._listeners
+        Showroom.__init__(self)
+        self._replaying = True
+        try:
+            self._build(self, checkpoint, path)
+        finally:
+            self._replaying = False
+        self.journal, self._listeners = journal, listeners
+        self._since_checkpoint = len(path)
+        if journal is not None:
+            # The journal still holds the undone records; a snapshot
+            # supersedes them
+            journal.snapshot(self)
+        self._notify("reset")
+        return undone
+
+    def as_of(self, when):
+        """A new Showroom with the state as it was at `when`: a datetime,
+        seconds since the epoch, or a date for the state at the end of
+        that day. Times before the first event give the starting state.
+        Holds that have expired since are left out."""
+        if isinstance(when, datetime):
+            when = when.timestamp()
+        elif isinstance(when, date):
+            when = datetime.combine(when + timedelta(days=1), datetime.min.time()).timestamp()
+        i = bisect_right(self._times, when)
+        head = self._heads[i - 1] if i else None
+        return self._build(Showroom(), *self._path_from_checkpoint(head))
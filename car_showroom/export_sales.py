@@ -0,0 +1,156 @@
+import argparse
+import csv
+import json
+import struct
+import sys
+from array import array
+from itertools import islice
+
+# Flattened sale fields and how the columnar format stores each one
+# (an array typecode, or "str" for length-prefixed UTF-8)
+COLUMNS = [
+    ("sale_number", "q"),
+    ("car_id", "q"),
+    ("brand", "str"),
+    ("model", "str"),
+    ("year", "q"),
+    ("price", "d"),  # what the car sold for
+    ("customer_id", "q"),
+    ("customer_name", "str"),
+    ("customer_contact", "str"),
+    ("sold_at", "d"),  # seconds since the epoch
+]
+FIELDS = [name for name, _ in COLUMNS]
+
+COLUMNAR_MAGIC = b"SALESCOL2\n"
+
+def iter_sale_rows(showroom):
+    """Yield each sale as a flat tuple in FIELDS order, one at a time."""
+    for number, sale in enumerate(showroom.sales, 1):
+        car = sale['car']
+        customer = sale['customer']
+        yield (number, car.car_id, car.brand, car.model, car.year, sale['price'],
+               customer.customer_id, customer.name, customer.contact, sale['sold_at'])
+
+def export_csv(showroom, path):
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for row in iter_sale_rows(showroom):
+            writer.writerow(row)
+            count += 1
+    return count
+
+def export_jsonl(showroom, path):
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in iter_sale_rows(showroom):
+            f.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+            count += 1
+    return count
+
+def _write_array(f, column):
+    if sys.byteorder == "big":
+        column.byteswap()
+    f.write(column.tobytes())
+
+def _read_array(f, typecode, count):
+    column = array(typecode)
+    column.frombytes(f.read(column.itemsize * count))
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+def _write_strings(f, values):
+    encoded = [str(value).encode("utf-8") for value in values]
+    _write_array(f, array("I", map(len, encoded)))
+    f.write(b"".join(encoded))
+
+def _read_strings(f, count):
+    lengths = _read_array(f, "I", count)
+    data = f.read(sum(lengths))
+    values = []
+    start = 0
+    for length in lengths:
+        values.append(data[start:start + length].decode("utf-8"))
+        start += length
+    return values
+
+def export_columnar(showroom, path, chunk_size=65536):
+    """Write sales as a sequence of column chunks.
+
+    After COLUMNAR_MAGIC, each chunk is a little-endian uint32 row count
+    followed by every column in COLUMNS order. Numeric columns are raw
+    little-endian arrays; string columns are a uint32 array of UTF-8 byte
+    lengths followed by the concatenated bytes. Only one chunk is held in
+    memory at a time.
+    """
+    count = 0
+    rows = iter_sale_rows(showroom)
+    with open(path, "wb") as f:
+        f.write(COLUMNAR_MAGIC)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            f.write(struct.pack("<I", len(chunk)))
+            for i, (name, typecode) in enumerate(COLUMNS):
+                values = [row[i] for row in chunk]
+                if typecode == "str":
+                    _write_strings(f, values)
+                else:
+                    _write_array(f, array(typecode, values))
+            count += len(chunk)
+    return count
+
+def read_columnar(path):
+    """Yield each chunk of a columnar export as a dict of column name to
+    array (numeric columns) or list (string columns)."""
+    with open(path, "rb") as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar sales export")
+        while True:
+            header = f.read(4)
+            if not header:
+                return
+            (count,) = struct.unpack("<I", header)
+            chunk = {}
+            for name, typecode in COLUMNS:
+                if typecode == "str":
+                    chunk[name] = _read_strings(f, count)
+                else:
+                    chunk[name] = _read_array(f, typecode, count)
+            yield chunk
+
+EXPORTERS = {
+    "csv": export_csv,
+    "jsonl": export_jsonl,
+    "columnar": export_columnar,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Export sales records for downstream jobs.")
+    parser.add_argument("format", choices=sorted(EXPORTERS))
+    parser.add_argument("path", help="output file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", help="SQLite database to export from")
+    source.add_argument("--journal", help="journal directory to export from")
+    args = parser.parse_args()
+
+    if args.db:
+        from sqlite_backend import SQLiteShowroom
+        showroom = SQLiteShowroom(args.db)
+    else:
+        # Read only: an export must not start, trim or create a journal
+        from journal import load_showroom
+        showroom = load_showroom(args.journal)
+
+    count = EXPORTERS[args.format](showroom, args.path)
+    print(f"Exported {count} sales to {args.path}")
+
+    if args.db:
+        showroom.close()
+
+if __name__ == "__main__":
+    main()
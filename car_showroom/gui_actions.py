@@ -0,0 +1,69 @@
+import tkinter as tk
+from tkinter import messagebox
+from analytics import format_report
+
+class ShowroomActions:
+    """Handlers shared by the three GUIs, mixed into each GUI class.
+
+    Expects self.showroom and self.notebook, the Sell Car form's
+    sell_car_id_entry and sell_customer_id_entry, and the Analytics tab's
+    self.analytics and analytics_text; each GUI builds its own widgets and
+    wires these methods to them.
+    """
+
+    def find_cars(self, text):
+        return [(car.car_id, str(car)) for car in self.showroom.search_cars(text, limit=20, available_only=True)]
+
+    def pick_car(self, car_id):
+        self.sell_car_id_entry.delete(0, tk.END)
+        self.sell_car_id_entry.insert(0, str(car_id))
+
+    def find_customers(self, text):
+        return [(c.customer_id, str(c)) for c in self.showroom.search_customers(text, limit=20)]
+
+    def pick_customer(self, customer_id):
+        self.sell_customer_id_entry.delete(0, tk.END)
+        self.sell_customer_id_entry.insert(0, str(customer_id))
+
+    def reserve_car(self):
+        try:
+            car_id = int(self.sell_car_id_entry.get())
+            customer_id = int(self.sell_customer_id_entry.get())
+            
+            result = self.showroom.reserve_car(car_id, customer_id)
+            messagebox.showinfo("Result", result)
+            
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid IDs!")
+
+    def release_reservation(self):
+        try:
+            car_id = int(self.sell_car_id_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid Car ID!")
+            return
+        if self.showroom.release_reservation(car_id):
+            messagebox.showinfo("Result", f"Reservation of car {car_id} released.")
+        else:
+            messagebox.showinfo("Result", f"Car with ID {car_id} is not reserved.")
+
+    def watch_analytics_tab(self, analytics_frame):
+        # The report covers every sale, so it is only rebuilt while this
+        # tab is in view: on a change, or when the tab is next selected
+        self.analytics_frame = analytics_frame
+        self.analytics_stale = True
+        self.notebook.bind("<<NotebookTabChanged>>", self.refresh_analytics_if_shown, add="+")
+
+    def refresh_analytics(self):
+        # Only sales made since the last refresh are copied into the columns
+        self.analytics_text.delete(1.0, tk.END)
+        self.analytics_text.insert(tk.END, format_report(self.analytics))
+        self.analytics_stale = False
+
+    def mark_analytics_stale(self):
+        self.analytics_stale = True
+        self.refresh_analytics_if_shown()
+
+    def refresh_analytics_if_shown(self, event=None):
+        if self.analytics_stale and self.notebook.select() == str(self.analytics_frame):
+            self.refresh_analytics()
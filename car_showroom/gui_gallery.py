@@ -0,0 +1,129 @@
+import tkinter as tk
+from tkinter import ttk
+
+class VirtualGallery:
+    """A scrolling grid of cards over a list that may be far too long to
+    build a widget for every item.
+
+    count() returns the number of items and items(offset, limit) yields
+    `limit` items from offset. The canvas scroll region is sized for the
+    whole list, but cards only exist for the rows in view plus one either
+    side: as the canvas scrolls, cards whose slot has left the view are
+    hidden, then moved to the newly exposed slots and refilled. Building,
+    scrolling and memory therefore depend on the viewport, not on how many
+    items there are.
+
+    make_card(parent) builds an empty card widget and fill_card(card, item)
+    shows an item on it; each card is card_width x card_height pixels,
+    `columns` to a row. key(item) identifies items for update_item().
+    """
+
+    def __init__(self, parent, count, items, make_card, fill_card, card_width, card_height,
+                 columns=3, pad=10, key=None, bg=None):
+        self.count = count
+        self.items = items
+        self.make_card = make_card
+        self.fill_card = fill_card
+        self.key = key or (lambda item: item)
+        self.columns = columns
+        self.total = 0
+        self._card_width = card_width
+        self._card_height = card_height
+        self._pad = pad
+        self._slot_width = card_width + 2 * pad
+        self._row_height = card_height + 2 * pad
+        # Slot (position in the list) -> (card, canvas window, item) for
+        # the cards in view, and (card, canvas window) for hidden ones
+        # waiting to be reused
+        self._shown = {}
+        self._spare = []
+        self.frame = tk.Frame(parent, bg=bg)
+        self.canvas = tk.Canvas(self.frame, bg=bg, highlightthickness=0, yscrollincrement=self._row_height)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._scrolled)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+        self._bind_wheel(self.canvas)
+
+    def refresh(self):
+        """Re-read the item count and refill every card in view."""
+        self._reload(0)
+
+    def update_item(self, key, fill=None):
+        """Refill the card showing the item with this key, if it is in
+        view, with fill(card, item) if given (e.g. to update one label)
+        or fill_card."""
+        for card, window, item in self._shown.values():
+            if self.key(item) == key:
+                (fill or self.fill_card)(card, item)
+
+    def items_inserted(self, index, count=1):
+        """count items were added at position index."""
+        self._reload(index)
+
+    def items_removed(self, index, count=1):
+        """count items were removed from position index."""
+        self._reload(index)
+
+    def _reload(self, index):
+        # Cards before index still show the right items; those from it
+        # on are refilled, which is nothing if index is below the view
+        self.total = self.count()
+        rows = -(-self.total // self.columns)
+        self.canvas.configure(scrollregion=(0, 0, self.columns * self._slot_width, rows * self._row_height))
+        for slot in [slot for slot in self._shown if slot >= index]:
+            self._release(slot)
+        self._layout()
+
+    def _release(self, slot):
+        card, window, item = self._shown.pop(slot)
+        self.canvas.itemconfigure(window, state="hidden")
+        self._spare.append((card, window))
+
+    def _layout(self):
+        columns = self.columns
+        top = int(self.canvas.canvasy(0))
+        bottom = top + self.canvas.winfo_height()
+        # The rows in view plus one either side, so a small scroll never
+        # shows an empty slot
+        first = max(0, top // self._row_height - 1) * columns
+        stop = min(self.total, (bottom // self._row_height + 2) * columns)
+        for slot in [slot for slot in self._shown if not first <= slot < stop]:
+            self._release(slot)
+        missing = [slot for slot in range(first, stop) if slot not in self._shown]
+        if not missing:
+            return
+        start = missing[0]
+        for slot, item in enumerate(self.items(start, missing[-1] + 1 - start), start):
+            if slot in self._shown:
+                continue
+            if self._spare:
+                card, window = self._spare.pop()
+                self.canvas.itemconfigure(window, state="normal")
+            else:
+                card = self.make_card(self.canvas)
+                window = self.canvas.create_window(0, 0, window=card, anchor=tk.NW,
+                                                   width=self._card_width, height=self._card_height)
+                self._bind_wheel(card)
+            self.canvas.coords(window, self._pad + slot % columns * self._slot_width,
+                               self._pad + slot // columns * self._row_height)
+            self.fill_card(card, item)
+            self._shown[slot] = (card, window, item)
+
+    def _scrolled(self, first, last):
+        self.scrollbar.set(first, last)
+        self._layout()
+
+    def _bind_wheel(self, widget):
+        # Cards cover most of the canvas, so they scroll it too
+        widget.bind("<MouseWheel>", self._wheel)
+        widget.bind("<Button-4>", lambda event: self.canvas.yview_scroll(-1, "units"))
+        widget.bind("<Button-5>", lambda event: self.canvas.yview_scroll(1, "units"))
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _wheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small steps;
+        # one unit is one row of cards
+        self.canvas.yview_scroll(-(event.delta // 120 or 1), "units")
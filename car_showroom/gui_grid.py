@@ -0,0 +1,227 @@
+import tkinter as tk
+from tkinter import ttk
+from car_showroom import _format_time
+
+# Rewrites the pooled items with a window of rows (values, tags, values,
+# tags, ...), inserting items if there are more rows than items and
+# deleting any left over. Returns the items in use, top to bottom.
+_RENDER_SCRIPT = """{tree items rows} {
+    set shown {}
+    foreach {values tags} $rows {
+        if {[llength $items]} {
+            set items [lassign $items item]
+            $tree item $item -values $values -tags $tags
+        } else {
+            set item [$tree insert {} end -values $values -tags $tags]
+        }
+        lappend shown $item
+    }
+    if {[llength $items]} {
+        $tree delete $items
+    }
+    return $shown
+}"""
+
+class VirtualGrid:
+    """A ttk.Treeview table over a list that may be far too long to load.
+
+    count() returns the number of rows and rows(offset, limit) yields
+    (values, tag) for `limit` rows from offset. Only the rows in view are
+    ever fetched: the Treeview holds one item per visible line, the
+    scrollbar is sized against the whole list, and scrolling (scrollbar,
+    mouse wheel, Page Up/Down, Home/End) fetches the rows at the new
+    position and rewrites those items in place, in a single Tcl call.
+    refresh() costs one window of rows however long the list is.
+
+    When the caller knows what changed, update_row(), rows_inserted() and
+    rows_removed() touch only the affected item, or at most redraw the
+    window, instead of refetching it; rows are identified by their first
+    value (the ID).
+
+    columns is a list of (heading, width); tags maps a row tag to
+    Treeview tag options such as foreground. Pass themed=True for ttk
+    frame widgets, otherwise label_options and frame_options style plain
+    tk widgets to match the surrounding tab.
+    """
+
+    def __init__(self, parent, columns, count, rows, height=20, tags=None, themed=False,
+                 label_options=None, **frame_options):
+        self.count = count
+        self.rows = rows
+        self.top = 0
+        self.total = 0
+        self._visible = height
+        # Treeview items in view, top to bottom, and the first value of the
+        # row each one shows
+        self._items = []
+        self._keys = []
+        widgets = ttk if themed else tk
+        self.frame = widgets.Frame(parent, **frame_options)
+        names = [f"c{i}" for i in range(len(columns))]
+        self.tree = ttk.Treeview(self.frame, columns=names, show="headings", height=height, selectmode="browse")
+        for name, (heading, width) in zip(names, columns):
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=width, anchor=tk.W)
+        for tag, options in (tags or {}).items():
+            self.tree.tag_configure(tag, **options)
+        self.scrollbar = widgets.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._scroll)
+        self._label = widgets.Label(self.frame, **(label_options or {}))
+        self._label.pack(side=tk.BOTTOM, anchor=tk.W)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.bind("<Configure>", self._resize)
+        self.tree.bind("<MouseWheel>", self._wheel)
+        self.tree.bind("<Button-4>", lambda event: self._jump(self.top - 3))
+        self.tree.bind("<Button-5>", lambda event: self._jump(self.top + 3))
+        self.tree.bind("<Prior>", lambda event: self._jump(self.top - self._visible))
+        self.tree.bind("<Next>", lambda event: self._jump(self.top + self._visible))
+        self.tree.bind("<Home>", lambda event: self._jump(0))
+        self.tree.bind("<End>", lambda event: self._jump(self.total))
+
+    def refresh(self):
+        """Re-read the row count and the rows in view."""
+        self.total = self.count()
+        self.top = max(0, min(self.top, self.total - self._visible))
+        self._render()
+
+    def scroll_to(self, top):
+        top = max(0, min(top, self.total - self._visible))
+        if top != self.top:
+            self.top = top
+            self.tree.selection_set(())
+            self._render()
+
+    def update_row(self, key, values, tag=None):
+        """Rewrite the row with first value key, if it is in view."""
+        try:
+            i = self._keys.index(key)
+        except ValueError:
+            return
+        self.tree.item(self._items[i], values=values, tags=(tag,) if tag else ())
+
+    def rows_inserted(self, index, count=1):
+        """count rows were added at position index."""
+        self.total += count
+        if index < self.top:
+            # Above the view: keep showing the same rows
+            self.top += count
+            self._show_position()
+        elif index < self.top + self._visible:
+            self._render()
+        else:
+            self._show_position()
+
+    def rows_removed(self, index, count=1):
+        """count rows were removed from position index."""
+        self.total -= count
+        in_view = index + count > self.top and index < self.top + len(self._items)
+        if index + count <= self.top:
+            self.top -= count
+        elif in_view:
+            self.top = min(self.top, index)
+        top = max(0, min(self.top, self.total - self._visible))
+        if in_view or top != self.top:
+            self.top = top
+            self._render()
+        else:
+            self._show_position()
+
+    def _render(self):
+        # The whole window goes to Tcl in one call rather than one
+        # item/insert call per row
+        keys = []
+        rows = []
+        for values, tag in self.rows(self.top, self._visible):
+            keys.append(values[0])
+            rows.append(values)
+            rows.append((tag,) if tag else ())
+        shown = self.tree.tk.call("apply", _RENDER_SCRIPT, self.tree, tuple(self._items), tuple(rows))
+        self._items = list(self.tree.tk.splitlist(shown))
+        self._keys = keys
+        self._show_position()
+
+    def _show_position(self):
+        shown = len(self._items)
+        if self.total:
+            self.scrollbar.set(self.top / self.total, (self.top + shown) / self.total)
+            self._label.config(text=f"Rows {self.top + 1}-{self.top + shown} of {self.total}")
+        else:
+            self.scrollbar.set(0, 1)
+            self._label.config(text="No rows")
+
+    def _scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.total))
+        elif unit == "pages":
+            self.scroll_to(self.top + int(amount) * self._visible)
+        else:
+            self.scroll_to(self.top + int(amount))
+
+    def _jump(self, top):
+        self.scroll_to(top)
+        return "break"
+
+    def _wheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small steps
+        return self._jump(self.top - 3 * (event.delta // 120 or 1))
+
+    def _resize(self, event):
+        # One item per line that fits under the heading row
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible = max(1, event.height // row_height - 1)
+        if visible != self._visible:
+            self._visible = visible
+            self.refresh()
+
+# Columns and row sources for the cars, customers and sales tabs
+
+CAR_COLUMNS = [("ID", 60), ("Brand", 120), ("Model", 120), ("Year", 60), ("Price", 100), ("Status", 200)]
+CUSTOMER_COLUMNS = [("ID", 60), ("Name", 200), ("Contact", 260)]
+SALE_COLUMNS = [("#", 60), ("Car", 260), ("Customer", 200), ("Sold On", 140)]
+
+def car_row(showroom, car):
+    """(values, tag) for CAR_COLUMNS, tagged "available", "reserved" or
+    "sold"."""
+    status = showroom.car_status(car)
+    return (car.car_id, car.brand, car.model, car.year, f"${car.price}", status), status.split()[0].lower()
+
+def car_rows(showroom, offset, limit):
+    for car in showroom.iter_cars(offset, limit):
+        yield car_row(showroom, car)
+
+def customer_rows(showroom, offset, limit):
+    for customer in showroom.iter_customers(offset, limit):
+        yield (customer.customer_id, customer.name, customer.contact), None
+
+def sale_rows(showroom, offset, limit):
+    for number, sale in enumerate(showroom.iter_sales(offset, limit), offset + 1):
+        yield (number, str(sale['car']), str(sale['customer']), _format_time(sale['sold_at'])), None
+
+def apply_change(showroom, change, data, cars_grid, customers_grid, sales_grid):
+    """Bring the cars, customers and sales grids up to date with one
+    Showroom.subscribe() notification, touching only the rows it affects:
+    a sale rewrites the car's row and appends to the sales grid, a hold
+    rewrites the car's row, an added or removed car or customer shifts its
+    grid only if it lands in view. Bulk loads and resets refetch the
+    window of the grids they affect."""
+    if change == "add_car":
+        cars_grid.rows_inserted(showroom.car_index(data["car"].car_id))
+    elif change == "remove_car":
+        cars_grid.rows_removed(showroom.car_index(data["car"].car_id))
+    elif change == "add_customer":
+        customers_grid.rows_inserted(showroom.customer_index(data["customer"].customer_id))
+    elif change in ("sell_car", "sell_cars"):
+        cars = data["cars"] if change == "sell_cars" else [data["car"]]
+        for car in cars:
+            cars_grid.update_row(car.car_id, *car_row(showroom, car))
+        sales_grid.rows_inserted(len(showroom.sales) - len(cars), len(cars))
+    elif change in ("reserve_car", "release_reservation"):
+        cars_grid.update_row(data["car"].car_id, *car_row(showroom, data["car"]))
+    elif change == "add_cars":
+        cars_grid.refresh()
+    elif change == "add_customers":
+        customers_grid.refresh()
+    else:
+        cars_grid.refresh()
+        customers_grid.refresh()
+        sales_grid.refresh()
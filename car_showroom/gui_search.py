@@ -0,0 +1,43 @@
+import tkinter as tk
+from tkinter import ttk
+
+class SearchBox:
+    """A search entry with a list of matches underneath, updated as the
+    user types.
+
+    search(text) returns (value, label) pairs for the current text; picking
+    a match (click or Return) calls on_pick(value). Pass themed=True for a
+    ttk entry, otherwise entry_options and listbox_options style plain tk
+    widgets to match the surrounding form.
+    """
+
+    def __init__(self, parent, search, on_pick, height=5, themed=False,
+                 entry_options=None, listbox_options=None, **frame_options):
+        self.search = search
+        self.on_pick = on_pick
+        self._values = []
+        widgets = ttk if themed else tk
+        self.frame = widgets.Frame(parent, **frame_options)
+        self.entry = widgets.Entry(self.frame, **(entry_options or {}))
+        self.entry.pack(fill=tk.X)
+        self.listbox = tk.Listbox(self.frame, height=height, **(listbox_options or {}))
+        self.listbox.pack(fill=tk.X, pady=(2, 0))
+        self.entry.bind("<KeyRelease>", self._update)
+        self.listbox.bind("<<ListboxSelect>>", self._pick)
+        self.listbox.bind("<Return>", self._pick)
+
+    def _update(self, event=None):
+        matches = self.search(self.entry.get()) if self.entry.get().strip() else []
+        self._values = [value for value, _ in matches]
+        self.listbox.delete(0, tk.END)
+        for _, label in matches:
+            self.listbox.insert(tk.END, label)
+
+    def _pick(self, event=None):
+        selection = self.listbox.curselection()
+        if selection:
+            self.on_pick(self._values[selection[0]])
+
+    def clear(self):
+        self.entry.delete(0, tk.END)
+        self._update()
@@ -0,0 +1,476 @@
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+import traceback
+from datetime import date
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+from car_showroom import RESERVATION_HOURS, Car, Customer
+from event_store import EventSourcedShowroom
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large",
+           431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+MAX_BODY = 1 << 20
+
+def car_to_dict(car):
+    return {
+        "car_id": car.car_id,
+        "brand": car.brand,
+        "model": car.model,
+        "year": car.year,
+        "price": car.price,
+        "image_path": car.image_path,
+        "is_available": car.is_available,
+    }
+
+def customer_to_dict(customer):
+    return {"customer_id": customer.customer_id, "name": customer.name, "contact": customer.contact}
+
+def sale_to_dict(sale):
+    return {"car": car_to_dict(sale['car']), "customer": customer_to_dict(sale['customer']),
+            "sold_at": sale['sold_at'], "price": sale['price']}
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _page_params(query):
+    try:
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 100))
+        after_id = int(query["after_id"]) if "after_id" in query else None
+    except ValueError:
+        raise HTTPError(400, "offset, limit and after_id must be integers")
+    if offset < 0 or limit < 0:
+        raise HTTPError(400, "offset and limit cannot be negative")
+    return offset, limit, after_id
+
+def _page(items, query):
+    offset, limit, _ = _page_params(query)
+    return list(islice(items, offset, offset + limit))
+
+def _number_param(query, name):
+    if name not in query:
+        return None
+    try:
+        return float(query[name])
+    except ValueError:
+        raise HTTPError(400, f"{name} must be a number")
+
+def _date_param(query, name):
+    if name not in query:
+        return None
+    try:
+        return date.fromisoformat(query[name])
+    except ValueError:
+        raise HTTPError(400, f"{name} must be a date (YYYY-MM-DD)")
+
+def _int_id(value):
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPError(404, "Not found")
+
+def _int_field(value, name):
+    # int() would turn true into 1 and truncate 2.5 to 2
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise HTTPError(400, f"{name} must be an integer")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"{name} must be an integer")
+
+def _str_field(value, name, optional=False):
+    if optional and value is None:
+        return value
+    if not isinstance(value, str):
+        raise HTTPError(400, f"{name} must be a string")
+    return value
+
+def _price_field(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise HTTPError(400, "price must be a number")
+    return value
+
+class ShowroomAPI:
+    """Routes JSON requests to a Showroom (or SQLiteShowroom).
+
+    GET  /cars             ?offset=&limit=&after_id= or ?min_price=&max_price=&min_year=&max_year=
+                           or ?q=<brand/model, typos allowed>&limit=&available=1
+    GET  /cars/<id>
+    POST /cars             {"car_id", "brand", "model", "year", "price", "image_path"?}
+    GET  /customers        ?offset=&limit=&after_id= or ?q=<name/contact prefix>&limit=
+    GET  /customers/<id>
+    POST /customers        {"customer_id", "name", "contact"}
+    GET  /sales            ?offset=&limit=
+    POST /sales            {"car_id", "customer_id"} or {"car_ids": [...], "customer_id"} (all or nothing)
+    GET  /reservations
+    POST /reservations     {"car_id", "customer_id", "hours"?}
+    DELETE /reservations/<car_id>
+    GET  /sales/rollup     ?period=day|week|month&start=YYYY-MM-DD&end=YYYY-MM-DD
+    GET  /stats
+    POST /undo             {"count"?}  (undo the last operations; EventSourcedShowroom only)
+
+    With an EventSourcedShowroom, GET /cars and GET /stats also take
+    ?as_of=YYYY-MM-DD for the inventory as it was at the end of that day.
+    """
+
+    def __init__(self, showroom):
+        self.showroom = showroom
+
+    def handle(self, method, target, body):
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+        if not parts:
+            raise HTTPError(404, "Not found")
+        resource, rest = parts[0], parts[1:]
+        showroom = self.showroom
+        if "as_of" in query and method == "GET" and resource in ("cars", "stats") and not rest:
+            showroom = self._past_showroom(query)
+
+        if resource == "stats" and not rest:
+            self._allow(method, "GET")
+            return 200, showroom.get_stats()
+
+        if resource == "undo" and not rest:
+            self._allow(method, "POST")
+            return self._undo(body)
+
+        if resource == "cars":
+            if rest:
+                self._allow(method, "GET")
+                car = self.showroom.get_car(_int_id(rest[0]))
+                if car is None:
+                    raise HTTPError(404, f"Car with ID {rest[0]} not found.")
+                return 200, car_to_dict(car)
+            if method == "POST":
+                return self._add_car(body)
+            self._allow(method, "GET")
+            if "q" in query:
+                _, limit, _ = _page_params(query)
+                cars = showroom.search_cars(query["q"], limit, available_only=query.get("available") == "1")
+                return 200, [car_to_dict(car) for car in cars]
+            if any(name in query for name in ("min_price", "max_price", "min_year", "max_year")):
+                return 200, [car_to_dict(car) for car in _page(self._filtered_cars(showroom, query), query)]
+            # Unfiltered listings page by car_id; after_id=<last id seen>
+            # fetches the next page without counting through the earlier ones
+            return 200, [car_to_dict(car) for car in showroom.iter_cars(*_page_params(query))]
+
+        if resource == "customers":
+            if rest:
+                self._allow(method, "GET")
+                customer = self.showroom.get_customer(_int_id(rest[0]))
+                if customer is None:
+                    raise HTTPError(404, f"Customer with ID {rest[0]} not found.")
+                return 200, customer_to_dict(customer)
+            if method == "POST":
+                return self._add_customer(body)
+            self._allow(method, "GET")
+            if "q" in query:
+                _, limit, _ = _page_params(query)
+                return 200, [customer_to_dict(c) for c in self.showroom.search_customers(query["q"], limit)]
+            return 200, [customer_to_dict(c) for c in self.showroom.iter_customers(*_page_params(query))]
+
+        if resource == "sales" and not rest:
+            if method == "POST":
+                return self._sell_car(body)
+            self._allow(method, "GET")
+            offset, limit, _ = _page_params(query)
+            return 200, [sale_to_dict(sale) for sale in self.showroom.iter_sales(offset, limit)]
+
+        if resource == "reservations":
+            if rest:
+                self._allow(method, "DELETE")
+                car_id = _int_id(rest[0])
+                if not self.showroom.release_reservation(car_id):
+                    raise HTTPError(404, f"Car with ID {car_id} is not reserved.")
+                return 200, {"message": f"Reservation of car {car_id} released."}
+            if method == "POST":
+                return self._reserve_car(body)
+            self._allow(method, "GET")
+            return 200, [{"car_id": car_id, "customer_id": customer_id, "expires_at": expires_at}
+                         for car_id, customer_id, expires_at in _page(self.showroom.iter_reservations(), query)]
+
+        if resource == "sales" and rest == ["rollup"]:
+            self._allow(method, "GET")
+            try:
+                rows = self.showroom.sales_by_period(query.get("period", "day"),
+                                                     _date_param(query, "start"), _date_param(query, "end"))
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+            return 200, [{"start": start.isoformat(), "sales": count, "revenue": revenue}
+                         for start, count, revenue in rows]
+
+        raise HTTPError(404, "Not found")
+
+    def _allow(self, method, allowed):
+        if method != allowed:
+            raise HTTPError(405, f"{method} not allowed here")
+
+    def _filtered_cars(self, showroom, query):
+        # Price/year filters go through the sorted indexes (available cars only)
+        if "min_price" in query or "max_price" in query:
+            return showroom.cars_in_price_range(_number_param(query, "min_price"), _number_param(query, "max_price"))
+        return showroom.cars_in_year_range(_number_param(query, "min_year"), _number_param(query, "max_year"))
+
+    def _past_showroom(self, query):
+        if not hasattr(self.showroom, "as_of"):
+            raise HTTPError(400, "as_of needs a showroom that keeps its history")
+        return self.showroom.as_of(_date_param(query, "as_of"))
+
+    def _undo(self, body):
+        if not hasattr(self.showroom, "undo"):
+            raise HTTPError(404, "Not found")
+        _, data = self._json_body(body, [])
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Expected a JSON object")
+        count = _int_field(data.get("count", 1), "count")
+        if count < 1:
+            raise HTTPError(400, "count must be at least 1")
+        undone = self.showroom.undo(count)
+        if not undone:
+            raise HTTPError(409, "Nothing to undo.")
+        return 200, {"undone": undone}
+
+    def _json_body(self, body, fields):
+        try:
+            data = json.loads(body or b"{}")
+            return [data[field] for field in fields], data
+        except (ValueError, KeyError, TypeError) as e:
+            raise HTTPError(400, f"Expected JSON with {', '.join(fields)}: {e}")
+
+    def _add_car(self, body):
+        (car_id, brand, model, year, price), data = self._json_body(body, ["car_id", "brand", "model", "year", "price"])
+        # Every field is checked before the showroom is touched
+        car = Car(_int_field(car_id, "car_id"), _str_field(brand, "brand"), _str_field(model, "model"),
+                  _int_field(year, "year"), _price_field(price),
+                  _str_field(data.get("image_path"), "image_path", optional=True))
+        if not self.showroom.add_car(car):
+            raise HTTPError(409, f"Car with ID {car_id} already exists.")
+        return 201, car_to_dict(car)
+
+    def _add_customer(self, body):
+        (customer_id, name, contact), _ = self._json_body(body, ["customer_id", "name", "contact"])
+        customer = Customer(_int_field(customer_id, "customer_id"), _str_field(name, "name"),
+                            _str_field(contact, "contact"))
+        if not self.showroom.add_customer(customer):
+            raise HTTPError(409, f"Customer with ID {customer_id} already exists.")
+        return 201, customer_to_dict(customer)
+
+    def _sell_car(self, body):
+        _, data = self._json_body(body, [])
+        if isinstance(data, dict) and "car_ids" in data:
+            return self._sell_cars(body)
+        (car_id, customer_id), _ = self._json_body(body, ["car_id", "customer_id"])
+        message = self.showroom.sell_car(_int_field(car_id, "car_id"), _int_field(customer_id, "customer_id"))
+        return self._sale_result(message)
+
+    def _sell_cars(self, body):
+        (car_ids, customer_id), _ = self._json_body(body, ["car_ids", "customer_id"])
+        if not isinstance(car_ids, list):
+            raise HTTPError(400, "car_ids must be a list")
+        car_ids = [_int_field(car_id, "car_ids") for car_id in car_ids]
+        message = self.showroom.sell_cars(car_ids, _int_field(customer_id, "customer_id"))
+        if message.endswith("listed more than once.") or message == "No cars to sell.":
+            raise HTTPError(400, message)
+        return self._sale_result(message)
+
+    def _sale_result(self, message):
+        if message.endswith("not found."):
+            raise HTTPError(404, message)
+        if message.endswith("already sold.") or " is reserved until " in message:
+            raise HTTPError(409, message)
+        return 201, {"message": message}
+
+    def _reserve_car(self, body):
+        (car_id, customer_id), data = self._json_body(body, ["car_id", "customer_id"])
+        hours = data.get("hours", RESERVATION_HOURS)
+        if isinstance(hours, bool) or not isinstance(hours, (int, float)):
+            raise HTTPError(400, "hours must be a number")
+        try:
+            message = self.showroom.reserve_car(_int_field(car_id, "car_id"), _int_field(customer_id, "customer_id"), hours)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        if message.endswith("not found."):
+            raise HTTPError(404, message)
+        if message.endswith("already sold.") or " is reserved until " in message:
+            raise HTTPError(409, message)
+        return 201, {"message": message}
+
+def _response(status, payload, keep_alive):
+    body = json.dumps(payload).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("ascii") + body
+
+async def _read_line(reader, status, message):
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        # readline reports a line longer than the stream limit as ValueError
+        raise HTTPError(status, message)
+
+async def _read_request(reader):
+    """Read one request; returns (method, target, version, headers, body)
+    or None when the client closed the connection."""
+    request_line = await _read_line(reader, 400, "Request line too long")
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line")
+    headers = {}
+    while True:
+        line = await _read_line(reader, 431, "Header line too long")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length < 0:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(413, "Request body too large")
+    try:
+        body = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError:
+        raise HTTPError(400, "Request body shorter than Content-Length")
+    return method.upper(), target, version, headers, body
+
+async def _serve_connection(api, reader, writer):
+    # Requests on one connection are answered strictly in order, so clients
+    # may pipeline several requests before reading any response.
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except HTTPError as e:
+                # The rest of the stream cannot be trusted, so answer and close
+                writer.write(_response(e.status, {"error": str(e)}, False))
+                await writer.drain()
+                break
+            if request is None:
+                break
+            method, target, version, headers, body = request
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+            try:
+                status, payload = api.handle(method, target, body)
+            except HTTPError as e:
+                status, payload = e.status, {"error": str(e)}
+            except Exception:
+                # A bug in one handler should not take the connection down
+                traceback.print_exc(file=sys.stderr)
+                status, payload = 500, {"error": "Internal server error"}
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def start_server(showroom, host="127.0.0.1", port=8000):
+    api = ShowroomAPI(showroom)
+    return await asyncio.start_server(lambda r, w: _serve_connection(api, r, w), host, port)
+
+async def _bench_client(host, port, path, requests, pipeline):
+    reader, writer = await asyncio.open_connection(host, port)
+    request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("ascii")
+    remaining = requests
+    while remaining:
+        batch = min(pipeline, remaining)
+        writer.write(request * batch)
+        await writer.drain()
+        for _ in range(batch):
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line == b"\r\n":
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+        remaining -= batch
+    writer.close()
+
+async def benchmark(showroom, connections=8, requests=20000, pipeline=16, path="/cars/1"):
+    """Serve showroom on a local port and measure requests/second from
+    `connections` keep-alive clients, each pipelining `pipeline` requests."""
+    server = await start_server(showroom, port=0)
+    host, port = server.sockets[0].getsockname()[:2]
+    per_client = requests // connections
+    started = time.perf_counter()
+    await asyncio.gather(*(_bench_client(host, port, path, per_client, pipeline) for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+    server.close()
+    await server.wait_closed()
+    total = per_client * connections
+    print(f"{total} requests to {path} over {connections} connections (pipeline {pipeline}): "
+          f"{elapsed:.2f}s, {total / elapsed:,.0f} requests/s")
+    return total / elapsed
+
+def _sample_showroom():
+    showroom = EventSourcedShowroom()
+    showroom.add_car(Car(1, "Toyota", "Camry", 2022, 25000))
+    showroom.add_car(Car(2, "Honda", "Civic", 2021, 22000))
+    showroom.add_car(Car(3, "Ford", "Mustang", 2023, 35000))
+    showroom.add_customer(Customer(1, "John Doe", "john@email.com"))
+    showroom.add_customer(Customer(2, "Jane Smith", "jane@email.com"))
+    showroom.reset_history()
+    return showroom
+
+async def _serve_forever(showroom, host, port):
+    server = await start_server(showroom, host, port)
+    print(f"Serving showroom API on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the showroom as a JSON HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--db", help="SQLite database to serve")
+    source.add_argument("--journal", help="journal directory to serve")
+    parser.add_argument("--bench", action="store_true", help="benchmark against a local client and exit")
+    args = parser.parse_args()
+
+    if args.db:
+        from sqlite_backend import SQLiteShowroom
+        showroom = SQLiteShowroom(args.db)
+    elif args.journal:
+        from journal import open_showroom
+        showroom = open_showroom(args.journal, EventSourcedShowroom())
+        showroom.reset_history()
+    else:
+        showroom = _sample_showroom()
+
+    try:
+        if args.bench:
+            asyncio.run(benchmark(showroom))
+        else:
+            asyncio.run(_serve_forever(showroom, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.db:
+            showroom.close()
+        elif args.journal:
+            showroom.journal.close()
+
+if __name__ == "__main__":
+    main()
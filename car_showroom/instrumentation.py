@@ -0,0 +1,232 @@
+import atexit
+import cProfile
+import functools
+import io
+import os
+import pstats
+import time
+
+# Showroom methods that are timed by default
+SHOWROOM_METHODS = [
+    "add_car", "add_cars", "remove_car", "add_customer", "add_customers", "sell_car", "sell_cars",
+    "reserve_car", "release_reservation",
+    "cars_in_price_range", "cars_in_year_range", "get_stats",
+    "sales_by_period", "sales_between", "sales_this", "undo", "as_of",
+    "get_cars_display", "get_customers_display", "get_sales_display",
+    "display_cars", "display_customers", "display_sales",
+]
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in nanoseconds, in the style of
+    HdrHistogram: values below 2**significant_bits are counted exactly, and
+    above that each power of two is split into 2**(significant_bits - 1)
+    equal buckets, so every recorded value is kept to within about
+    2**-(significant_bits - 1) of its true size (0.8% by default) in a
+    few thousand counters at most."""
+
+    def __init__(self, significant_bits=8):
+        self._bits = significant_bits
+        self._half = 1 << (significant_bits - 1)
+        self.clear()
+
+    def clear(self):
+        self._counts = []
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        exponent = value.bit_length() - self._bits
+        if exponent <= 0:
+            return value
+        return exponent * self._half + (value >> exponent)
+
+    def _highest_equivalent(self, index):
+        if index < 2 * self._half:
+            return index
+        exponent = index // self._half - 1
+        return ((index - exponent * self._half + 1) << exponent) - 1
+
+    def record(self, nanoseconds):
+        # Called on every instrumented call, so _index() is inlined here
+        value = int(nanoseconds) if nanoseconds > 0 else 0
+        exponent = value.bit_length() - self._bits
+        index = value if exponent <= 0 else exponent * self._half + (value >> exponent)
+        try:
+            self._counts[index] += 1
+        except IndexError:
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+            self._counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def merge(self, other):
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Smallest recorded value (to histogram precision) that at least
+        `percent` percent of all values are less than or equal to."""
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def summary(self):
+        """Dict of count and latencies in microseconds."""
+        return {
+            "count": self.count,
+            "mean_us": self.mean / 1000,
+            "min_us": (self.min or 0) / 1000,
+            "p50_us": self.percentile(50) / 1000,
+            "p90_us": self.percentile(90) / 1000,
+            "p99_us": self.percentile(99) / 1000,
+            "p999_us": self.percentile(99.9) / 1000,
+            "max_us": self.max / 1000,
+        }
+
+class Instrumentation:
+    """Opt-in call counting and latency histograms for Showroom methods (or
+    methods of any object, such as a GUI's refresh handlers).
+
+    instrument() replaces the chosen methods on that one instance with
+    timing wrappers; objects that are never instrumented run exactly as
+    before, and uninstrument() puts the original methods back. Setting
+    `enabled` to False leaves the wrappers in place but makes them call
+    straight through. Histograms are not locked, so with many threads a
+    few counts may be lost; they are meant for spotting slow operations,
+    not for accounting.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.histograms = {}
+        self._instrumented = []
+        self._profiler = None
+        self._profile_until = None
+        self._profile_path = None
+        self.last_profile_report = None
+
+    def instrument(self, obj, methods=SHOWROOM_METHODS, prefix=""):
+        """Wrap obj's named methods; each is recorded as prefix + name.
+        Names obj does not have are skipped. Returns obj."""
+        for name in methods:
+            original = getattr(obj, name, None)
+            if not callable(original):
+                continue
+            histogram = self.histograms.setdefault(prefix + name, LatencyHistogram())
+            setattr(obj, name, self._wrap(original, histogram))
+            self._instrumented.append((obj, name))
+        return obj
+
+    def uninstrument(self):
+        for obj, name in self._instrumented:
+            obj.__dict__.pop(name, None)
+        self._instrumented.clear()
+
+    def _wrap(self, method, histogram):
+        clock = time.perf_counter_ns
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            if not self.enabled:
+                return method(*args, **kwargs)
+            started = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.record(clock() - started)
+                if self._profile_until is not None and clock() >= self._profile_until:
+                    self.stop_profile()
+        return timed
+
+    def reset(self):
+        # Cleared in place: each wrapper holds on to its histogram
+        for histogram in self.histograms.values():
+            histogram.clear()
+
+    def summary(self):
+        return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())
+                if histogram.count}
+
+    def report(self):
+        lines = [f"{'operation':<28} {'calls':>9} {'mean':>10} {'p50':>10} {'p99':>10} {'p99.9':>10} {'max':>10}  (us)"]
+        for name, s in self.summary().items():
+            lines.append(f"{name:<28} {s['count']:>9} {s['mean_us']:>10.1f} {s['p50_us']:>10.1f} "
+                         f"{s['p99_us']:>10.1f} {s['p999_us']:>10.1f} {s['max_us']:>10.1f}")
+        return "\n".join(lines)
+
+    # cProfile window: profile everything the calling thread does between
+    # start_profile() and stop_profile(), or for `seconds` (checked when an
+    # instrumented call returns, so the profiler is stopped on the thread
+    # that started it as long as that thread makes the calls).
+
+    def start_profile(self, seconds=None, path=None):
+        if self._profiler is not None:
+            return
+        self._profile_path = path
+        self._profile_until = None if seconds is None else time.perf_counter_ns() + int(seconds * 1e9)
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_profile(self, path=None, sort="cumulative", limit=30):
+        """Stop the profiler and return a pstats report; the raw stats are
+        also written to `path` (or the path given to start_profile) for
+        loading into pstats or snakeviz later."""
+        profiler = self._profiler
+        if profiler is None:
+            return None
+        profiler.disable()
+        self._profiler = None
+        self._profile_until = None
+        path = path or self._profile_path
+        if path:
+            profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+        self.last_profile_report = out.getvalue()
+        return self.last_profile_report
+
+def from_environment(showroom, gui=None, gui_methods=()):
+    """Instrument showroom (and gui_methods of gui, recorded as "gui.<name>")
+    when the SHOWROOM_INSTRUMENT environment variable is set, printing the
+    latency report at exit. If SHOWROOM_PROFILE names a file, a cProfile
+    window covering SHOWROOM_PROFILE_SECONDS (default: the whole run) is
+    written there too. Returns the Instrumentation, or None when disabled."""
+    if not os.environ.get("SHOWROOM_INSTRUMENT"):
+        return None
+    instrumentation = Instrumentation()
+    instrumentation.instrument(showroom)
+    if gui is not None:
+        instrumentation.instrument(gui, gui_methods, prefix="gui.")
+    profile_path = os.environ.get("SHOWROOM_PROFILE")
+    if profile_path:
+        seconds = os.environ.get("SHOWROOM_PROFILE_SECONDS")
+        instrumentation.start_profile(float(seconds) if seconds else None, profile_path)
+
+    def report():
+        instrumentation.stop_profile()
+        print(instrumentation.report())
+    atexit.register(report)
+    return instrumentation
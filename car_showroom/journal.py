@@ -0,0 +1,255 @@
+import json
+import os
+from car_showroom import Car, Customer, Showroom
+
+SNAPSHOT_FILE = "snapshot.jsonl"
+JOURNAL_FILE = "journal.jsonl"
+
+def _car_row(tag, car):
+    return [tag, car.car_id, car.brand, car.model, car.year, car.price, car.image_path, car.is_available]
+
+def _car_from_row(row):
+    car = Car(*row[1:7])
+    car.is_available = row[7]
+    return car
+
+def _encode_record(op, data):
+    """The JSON row for a mutation reported to Showroom._log()."""
+    if op == "add_car":
+        return _car_row(op, data["car"])
+    if op == "add_customer":
+        customer = data["customer"]
+        return [op, customer.customer_id, customer.name, customer.contact]
+    if op == "remove_car":
+        return [op, data["car_id"]]
+    if op == "sell_car":
+        return [op, data["car_id"], data["customer_id"], data["sold_at"]]
+    if op == "sell_cars":
+        return [op, data["car_ids"], data["customer_id"], data["sold_at"]]
+    if op == "reserve_car":
+        return [op, data["car_id"], data["customer_id"], data["expires_at"]]
+    if op == "release_reservation":
+        return [op, data["car_id"]]
+    raise ValueError(f"Unknown journal operation: {op}")
+
+def _snapshot_rows(showroom):
+    """The whole showroom state as rows for _load_rows()."""
+    for car in showroom.cars:
+        yield _car_row("car", car)
+    for customer in showroom.customers:
+        yield ["customer", customer.customer_id, customer.name, customer.contact]
+    for sale in showroom.sales:
+        car = sale['car']
+        if showroom.get_car(car.car_id) != car:
+            # Sold and later removed: the sale still needs the car
+            yield _car_row("removed_car", car)
+        yield ["sale", car.car_id, sale['customer'].customer_id, sale['sold_at'], sale['price']]
+    for car_id, customer_id, expires_at in showroom.iter_reservations():
+        yield ["reservation", car_id, customer_id, expires_at]
+
+class ShowroomJournal:
+    """Append-only journal of Showroom mutations plus periodic snapshots.
+
+    Every add_car / remove_car / add_customer / sell_car / sell_cars /
+    reserve_car / release_reservation is written as one JSON line (a fleet
+    sale is one line, so it is replayed whole or not at all). Lines are
+    fsynced every sync_every records (and on sync() or close()), so a crash
+    loses at most the last unsynced batch. After snapshot_every records the
+    whole showroom is written to a compact snapshot and the journal starts
+    over, so recovery only has to load the snapshot and replay a short
+    tail. Use open_showroom() to recover.
+
+    Each snapshot and the journal started after it begin with the same
+    generation number. A crash after a snapshot is written but before the
+    new journal is started leaves a journal of the previous generation,
+    whose records the snapshot already holds, so recovery skips it rather
+    than applying them twice.
+
+    A snapshot is never taken before the journal holds as many records as
+    the showroom holds cars and customers, which keeps the snapshot cost
+    amortized O(1) per record during bulk loads.
+    """
+
+    def __init__(self, directory, sync_every=32, snapshot_every=10000):
+        self.directory = directory
+        self.sync_every = sync_every
+        self.snapshot_every = snapshot_every
+        os.makedirs(directory, exist_ok=True)
+        self._unsynced = 0
+        self._records = 0
+        self.generation = _generation(self._path(SNAPSHOT_FILE))
+        if _generation(self._path(JOURNAL_FILE)) == self.generation:
+            self._file = open(self._path(JOURNAL_FILE), "a", encoding="utf-8")
+        else:
+            # Left over from before the last snapshot, which covers it
+            self._start_journal()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def record(self, showroom, op, **data):
+        line = _encode_record(op, data)
+        self._file.write(json.dumps(line) + "\n")
+        self._unsynced += 1
+        self._records += 1
+        if self._records >= max(self.snapshot_every, showroom.car_count() + showroom.customer_count()):
+            self.snapshot(showroom)
+        elif self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        self.sync()
+        self._file.close()
+
+    def _start_journal(self):
+        self._file = open(self._path(JOURNAL_FILE), "w", encoding="utf-8")
+        self._file.write(json.dumps(["generation", self.generation]) + "\n")
+        self.sync()
+
+    def snapshot(self, showroom):
+        """Write the full showroom state and start an empty journal."""
+        generation = self.generation + 1
+        tmp_path = self._path(SNAPSHOT_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(["generation", generation]) + "\n")
+            for row in _snapshot_rows(showroom):
+                f.write(json.dumps(row) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path(SNAPSHOT_FILE))
+        # The snapshot covers everything journaled so far
+        self.generation = generation
+        self._file.close()
+        self._start_journal()
+        self._records = 0
+
+def _read_lines(path, truncate_torn=False):
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+" if truncate_torn else "rb") as f:
+        good_length = 0
+        for line in f:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("incomplete line")
+                row = json.loads(line)
+            except ValueError:
+                # A torn final write from a crash; everything before it is
+                # good. Cut it off so new records are not appended after it.
+                if truncate_torn:
+                    f.truncate(good_length)
+                return
+            good_length += len(line)
+            yield row
+
+def _generation(path):
+    """The generation a snapshot or journal file starts with; 0 for none
+    (no snapshot taken yet)."""
+    first = next(_read_lines(path), None)
+    return first[1] if first is not None and first[0] == "generation" else 0
+
+def _add_pending(showroom, cars, customers):
+    if cars:
+        showroom.add_cars(cars)
+        cars.clear()
+    if customers:
+        showroom.add_customers(customers)
+        customers.clear()
+
+def _load_rows(showroom, rows):
+    removed_cars = {}
+    # Snapshots list every car, then every customer, so both are loaded
+    # with bulk calls
+    cars = []
+    customers = []
+    for row in rows:
+        tag = row[0]
+        if tag == "car":
+            cars.append(_car_from_row(row))
+            continue
+        if tag == "customer":
+            customers.append(Customer(*row[1:]))
+            continue
+        if tag == "generation":
+            continue
+        _add_pending(showroom, cars, customers)
+        if tag == "removed_car":
+            removed_cars[row[1]] = _car_from_row(row)
+        elif tag == "sale":
+            car = removed_cars.pop(row[1], None) or showroom.get_car(row[1])
+            showroom.restore_sale(car, showroom.get_customer(row[2]), row[3], row[4])
+        elif tag == "reservation":
+            # Holds that ran out while the showroom was closed are dropped
+            # the first time reservations are looked at
+            showroom.reserve_car(row[1], row[2], expires_at=row[3])
+    _add_pending(showroom, cars, customers)
+
+def _apply_record(showroom, row):
+    """Redo one journaled mutation on showroom."""
+    op = row[0]
+    if op == "add_car":
+        showroom.add_car(_car_from_row(row))
+    elif op == "add_customer":
+        showroom.add_customer(Customer(*row[1:]))
+    elif op == "remove_car":
+        showroom.remove_car(row[1])
+    elif op == "sell_car":
+        showroom.sell_car(row[1], row[2], row[3])
+    elif op == "sell_cars":
+        showroom.sell_cars(row[1], row[2], row[3])
+    elif op == "reserve_car":
+        showroom.reserve_car(row[1], row[2], expires_at=row[3])
+    elif op == "release_reservation":
+        showroom.release_reservation(row[1])
+
+def _replay(showroom, path, truncate_torn=True):
+    # Runs of add_car / add_customer records (bulk imports) are applied in
+    # bulk calls; other records only depend on what was added before them
+    cars = []
+    customers = []
+    for row in _read_lines(path, truncate_torn):
+        op = row[0]
+        if op == "add_car":
+            cars.append(_car_from_row(row))
+            continue
+        if op == "add_customer":
+            customers.append(Customer(*row[1:]))
+            continue
+        if op == "generation":
+            continue
+        _add_pending(showroom, cars, customers)
+        _apply_record(showroom, row)
+    _add_pending(showroom, cars, customers)
+
+def _recover(showroom, directory, truncate_torn):
+    showroom.journal = None
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+    journal_path = os.path.join(directory, JOURNAL_FILE)
+    _load_rows(showroom, _read_lines(snapshot_path))
+    if _generation(journal_path) == _generation(snapshot_path):
+        _replay(showroom, journal_path, truncate_torn)
+
+def open_showroom(directory, showroom=None, **journal_options):
+    """Recover a showroom from directory (snapshot, then journal tail) and
+    attach a journal so further changes are recorded there."""
+    if showroom is None:
+        showroom = Showroom()
+    _recover(showroom, directory, truncate_torn=True)
+    showroom.journal = ShowroomJournal(directory, **journal_options)
+    return showroom
+
+def load_showroom(directory, showroom=None):
+    """Recover a showroom from directory like open_showroom, but read-only:
+    no journal is attached and no file is created or changed (a torn final
+    journal line is skipped, not cut off). For readers such as exports."""
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"No journal directory {directory}")
+    if showroom is None:
+        showroom = Showroom()
+    _recover(showroom, directory, truncate_torn=False)
+    return showroom
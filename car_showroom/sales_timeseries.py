@@ -0,0 +1,121 @@
+import calendar
+from datetime import date, datetime, timedelta
+
+PERIODS = ("day", "week", "month")
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+def _bucket(period, day):
+    """Integer key of the period containing day: the day's own ordinal, the
+    ordinal of its week's Monday, or the number of months since year 0."""
+    if period == "day":
+        return day.toordinal()
+    if period == "week":
+        return day.toordinal() - day.weekday()
+    if period == "month":
+        return day.year * 12 + day.month - 1
+    raise ValueError(f"Unknown period: {period} (expected one of {', '.join(PERIODS)})")
+
+def _bucket_start(period, key):
+    if period == "month":
+        return date(key // 12, key % 12 + 1, 1)
+    return date.fromordinal(key)
+
+_STEPS = {"day": 1, "week": 7, "month": 1}
+
+class SalesTimeSeries:
+    """Sale counts and revenue rolled up by day, week (Monday to Sunday) and
+    month, in local time.
+
+    record() adds each sale to its three buckets as it is made, so a period
+    query reads one bucket per period in the range instead of scanning the
+    sales history, and the rollups never have to be rebuilt.
+    """
+
+    def __init__(self):
+        # period -> {bucket key: [sales, revenue]}
+        self._buckets = {period: {} for period in PERIODS}
+        self.count = 0
+        self.revenue = 0
+        self.first = None
+        self.last = None
+        # (day start, next day start, day, bucket keys) of the last sale;
+        # sales mostly arrive in time order, so the next one usually falls
+        # on the same day and skips the date arithmetic
+        self._day = None
+
+    def __len__(self):
+        return self.count
+
+    def record(self, sold_at, price, sales=1):
+        """Add a sale made at sold_at (seconds since the epoch) for price,
+        or several made together (a fleet sale) for price in total."""
+        cached = self._day
+        if cached is None or not cached[0] <= sold_at < cached[1]:
+            day = datetime.fromtimestamp(sold_at).date()
+            cached = self._day = (
+                datetime.combine(day, datetime.min.time()).timestamp(),
+                datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp(),
+                day,
+                [(self._buckets[period], _bucket(period, day)) for period in PERIODS],
+            )
+        day = cached[2]
+        for buckets, key in cached[3]:
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [sales, price]
+            else:
+                bucket[0] += sales
+                bucket[1] += price
+        self.count += sales
+        self.revenue += price
+        if self.first is None or day < self.first:
+            self.first = day
+        if self.last is None or day > self.last:
+            self.last = day
+
+    def series(self, period="day", start=None, end=None):
+        """[(period start date, sales, revenue)] for every period from the
+        one containing start to the one containing end (by default the
+        first and last days with sales), empty periods included."""
+        buckets = self._buckets.get(period)
+        if buckets is None:
+            raise ValueError(f"Unknown period: {period} (expected one of {', '.join(PERIODS)})")
+        start = self.first if start is None else _as_date(start)
+        end = self.last if end is None else _as_date(end)
+        if start is None or end is None or start > end:
+            return []
+        keys = range(_bucket(period, start), _bucket(period, end) + 1, _STEPS[period])
+        return [(_bucket_start(period, key), *buckets.get(key, (0, 0))) for key in keys]
+
+    def totals(self, start, end):
+        """(sales, revenue) from start to end, both days included. Whole
+        months in the range are read from the monthly rollup and only the
+        days either side of them from the daily one, so a range of years
+        costs a few dozen lookups."""
+        start, end = _as_date(start), _as_date(end)
+        days = self._buckets["day"]
+        months = self._buckets["month"]
+        count = revenue = 0
+        day = start
+        while day <= end:
+            if day.day == 1:
+                month_end = day.replace(day=calendar.monthrange(day.year, day.month)[1])
+                if month_end <= end:
+                    sales, amount = months.get(_bucket("month", day), (0, 0))
+                    count += sales
+                    revenue += amount
+                    day = month_end + timedelta(days=1)
+                    continue
+            sales, amount = days.get(day.toordinal(), (0, 0))
+            count += sales
+            revenue += amount
+            day += timedelta(days=1)
+        return count, revenue
+
+    def current(self, period="day", today=None):
+        """(sales, revenue) so far in the day, week or month containing today."""
+        today = date.today() if today is None else _as_date(today)
+        _, count, revenue = self.series(period, today, today)[0]
+        return count, revenue
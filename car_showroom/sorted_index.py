@@ -0,0 +1,207 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from operator import itemgetter
+
+_entry_key = itemgetter(0)
+_entry_id = itemgetter(1)
+
+# Target number of entries per SortedIndex block
+BLOCK_SIZE = 1000
+
+class SortedIndex:
+    """Keeps (key, item_id) pairs sorted by key so range queries are a
+    binary search plus a slice instead of a scan over every item.
+
+    The pairs are held in sorted blocks of up to 2 * BLOCK_SIZE, with the
+    last pair of every block in a separate list for finding the right block
+    by binary search. Adding or removing a pair only shifts the rest of its
+    block, O(log n + BLOCK_SIZE), where one long list would move half the
+    index (about 100us per sale with half a million cars).
+    """
+
+    def __init__(self):
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def _rebuild(self, entries):
+        self._blocks = [entries[i:i + BLOCK_SIZE] for i in range(0, len(entries), BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(entries)
+
+    def add(self, key, item_id):
+        entry = (key, item_id)
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            return
+        i = bisect_left(self._maxes, entry)
+        if i == len(self._maxes):
+            i -= 1
+        block = self._blocks[i]
+        insort(block, entry)
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * BLOCK_SIZE:
+            rest = block[BLOCK_SIZE:]
+            del block[BLOCK_SIZE:]
+            self._blocks.insert(i + 1, rest)
+            self._maxes[i] = block[-1]
+            self._maxes.insert(i + 1, rest[-1])
+
+    def add_many(self, entries):
+        """Add an iterable of (key, item_id) pairs. Large batches are merged
+        with the existing pairs and re-sorted, which Timsort does in linear
+        time for two sorted runs, instead of paying an insert per pair."""
+        entries = sorted(entries)
+        if len(entries) < 64:
+            for entry in entries:
+                self.add(*entry)
+        else:
+            merged = list(chain.from_iterable(self._blocks))
+            merged.extend(entries)
+            merged.sort()
+            self._rebuild(merged)
+
+    def remove(self, key, item_id):
+        entry = (key, item_id)
+        i = bisect_left(self._maxes, entry)
+        if i == len(self._maxes):
+            return False
+        block = self._blocks[i]
+        j = bisect_left(block, entry)
+        if block[j] != entry:
+            return False
+        del block[j]
+        self._len -= 1
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+        return True
+
+    def _find(self, key):
+        """(block, position) of the first pair whose key is >= key."""
+        i = bisect_left(self._maxes, key, key=_entry_key)
+        if i == len(self._blocks):
+            return i, 0
+        return i, bisect_left(self._blocks[i], key, key=_entry_key)
+
+    def range(self, low=None, high=None):
+        """Return the item IDs whose key lies in [low, high], in key order.
+        Either bound may be None to leave that side open."""
+        i, j = (0, 0) if low is None else self._find(low)
+        found = []
+        for block in self._blocks[i:]:
+            if high is not None and block[-1][0] > high:
+                found.extend(map(_entry_id, block[j:bisect_right(block, high, key=_entry_key)]))
+                break
+            found.extend(map(_entry_id, block[j:]))
+            j = 0
+        return found
+
+    def prefix(self, prefix):
+        """Yield the item IDs whose (string) key starts with prefix, in key
+        order. Lazy, so taking the first k costs O(log n + k)."""
+        i, j = self._find(prefix)
+        blocks = self._blocks
+        while i < len(blocks):
+            block = blocks[i]
+            while j < len(block):
+                key, item_id = block[j]
+                if not key.startswith(prefix):
+                    return
+                yield item_id
+                j += 1
+            i += 1
+            j = 0
+
+class SortedIds:
+    """Item IDs kept in ascending order, for paging through items by
+    position (offset/limit) or by key (everything after a given ID) with a
+    binary search and a slice.
+
+    IDs are held in an int64 array, 8 bytes each with no per-ID objects;
+    the first ID that does not fit (a string, say) switches to a list.
+    """
+
+    def __init__(self):
+        self._ids = array('q')
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, item_id):
+        try:
+            i = bisect_left(self._ids, item_id)
+        except TypeError:
+            # Not comparable with the IDs held, so not one of them
+            return False
+        return i < len(self._ids) and self._ids[i] == item_id
+
+    def _use_list(self):
+        self._ids = list(self._ids)
+
+    def add(self, item_id):
+        try:
+            # IDs usually arrive in increasing order, so appending is the
+            # common case
+            if not self._ids or item_id > self._ids[-1]:
+                self._ids.append(item_id)
+            else:
+                insort(self._ids, item_id)
+        except (TypeError, OverflowError):
+            if isinstance(self._ids, list):
+                raise
+            self._use_list()
+            self.add(item_id)
+
+    def add_many(self, item_ids):
+        item_ids = sorted(item_ids)
+        if not item_ids:
+            return
+        try:
+            if isinstance(self._ids, array):
+                new_ids = array('q', item_ids)
+            else:
+                new_ids = item_ids
+            if not self._ids or item_ids[0] > self._ids[-1]:
+                self._ids.extend(new_ids)
+            elif len(item_ids) < 64:
+                for item_id in item_ids:
+                    insort(self._ids, item_id)
+            elif isinstance(self._ids, array):
+                self._ids = array('q', sorted(self._ids + new_ids))
+            else:
+                self._ids.extend(new_ids)
+                self._ids.sort()
+        except (TypeError, OverflowError):
+            if isinstance(self._ids, list):
+                raise
+            self._use_list()
+            self.add_many(item_ids)
+
+    def index(self, item_id):
+        """Position of item_id, or the position it would be added at."""
+        return bisect_left(self._ids, item_id)
+
+    def remove(self, item_id):
+        i = bisect_left(self._ids, item_id)
+        if i < len(self._ids) and self._ids[i] == item_id:
+            del self._ids[i]
+            return True
+        return False
+
+    def page(self, offset=0, limit=None, after_id=None):
+        """IDs from position `offset` on, counted from the first ID greater
+        than after_id when that is given; at most `limit` of them."""
+        start = offset
+        if after_id is not None:
+            start += bisect_right(self._ids, after_id)
+        stop = len(self._ids) if limit is None else start + limit
+        return self._ids[start:stop]
@@ -0,0 +1,537 @@
+import sqlite3
+import time
+from car_showroom import (RESERVATION_HOURS, Car, Customer, Showroom, _car_search_text,
+                          _check_batch_cars, _customer_search_keys, _format_time, _hold_expiry)
+from sales_timeseries import SalesTimeSeries
+from trigram_index import TrigramIndex
+
+SCHEMA = """
+-- A removed car keeps its row (and car_key) so old sales still show it;
+-- its car_id can then be given to a new car, which gets a row of its own
+CREATE TABLE IF NOT EXISTS cars (
+    car_key INTEGER PRIMARY KEY,
+    car_id INTEGER NOT NULL,
+    brand TEXT NOT NULL,
+    model TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    price NOT NULL,  -- no declared type, so whole-number prices stay integers
+    is_available INTEGER NOT NULL DEFAULT 1,
+    image_path TEXT,
+    removed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    contact TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sales (
+    sale_id INTEGER PRIMARY KEY,
+    car_key INTEGER NOT NULL REFERENCES cars (car_key),
+    customer_id INTEGER NOT NULL REFERENCES customers (customer_id),
+    sold_at REAL NOT NULL,  -- seconds since the epoch
+    price NOT NULL  -- what the car sold for
+);
+-- Cars on hold; rows past expires_at are ignored and deleted on the next write
+CREATE TABLE IF NOT EXISTS reservations (
+    car_id INTEGER PRIMARY KEY,
+    customer_id INTEGER NOT NULL REFERENCES customers (customer_id),
+    expires_at REAL NOT NULL
+);
+-- Same keys as Showroom's customer search index (see _customer_search_keys)
+CREATE TABLE IF NOT EXISTS customer_search (
+    key TEXT NOT NULL,
+    customer_id INTEGER NOT NULL REFERENCES customers (customer_id),
+    PRIMARY KEY (key, customer_id)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS cars_car_id ON cars (car_id) WHERE removed = 0;
+CREATE INDEX IF NOT EXISTS sales_car_key ON sales (car_key);
+CREATE INDEX IF NOT EXISTS sales_customer_id ON sales (customer_id);
+CREATE INDEX IF NOT EXISTS cars_available_price ON cars (is_available, removed, price);
+CREATE INDEX IF NOT EXISTS cars_available_year ON cars (is_available, removed, year);
+CREATE INDEX IF NOT EXISTS cars_brand_model ON cars (brand, model);
+CREATE INDEX IF NOT EXISTS reservations_expires_at ON reservations (expires_at);
+"""
+
+CAR_COLUMNS = "car_id, brand, model, year, price, image_path, is_available"
+# cars and sales both have a price column, so the sales join names them
+SALE_COLUMNS = ("car_id, brand, model, year, cars.price, image_path, is_available,"
+                " customer_id, name, contact, sold_at, sales.price")
+
+def _car_from_row(row):
+    car = Car(*row[:6])
+    car.is_available = bool(row[6])
+    return car
+
+def _car_params(car):
+    return (car.car_id, car.brand, car.model, car.year, car.price, car.image_path, int(car.is_available))
+
+def _sale_from_row(row):
+    return {
+        'car': _car_from_row(row[:7]),
+        'customer': Customer(*row[7:10]),
+        'sold_at': row[10],
+        'price': row[11]
+    }
+
+class _QueryView:
+    """Lazy, sized view over a query, so `for car in showroom.cars` and
+    `len(showroom.cars)` work without loading the table into memory."""
+
+    def __init__(self, connection, select_sql, count_sql, make_item):
+        self._connection = connection
+        self._select_sql = select_sql
+        self._count_sql = count_sql
+        self._make_item = make_item
+
+    def __iter__(self):
+        for row in self._connection.execute(self._select_sql):
+            yield self._make_item(row)
+
+    def __len__(self):
+        return self._connection.execute(self._count_sql).fetchone()[0]
+
+class SQLiteShowroom:
+    """Showroom backed by a SQLite database instead of in-memory dicts.
+
+    Offers the same add_car / remove_car / add_customer / sell_car / get_*
+    API as Showroom, but rows are read on demand, so opening a large
+    database does not load it into RAM. The database runs in WAL mode and
+    writes are committed in groups of batch_size. Call flush() or close()
+    (or use the showroom as a context manager) to commit the last group.
+    """
+
+    def __init__(self, path="showroom.db", batch_size=50):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = 0
+        # The sqlite3 module caches compiled statements per connection, so
+        # reusing the same SQL strings below gives us prepared statements.
+        self._connection = sqlite3.connect(path, cached_statements=64)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._connection.commit()
+        # Built on the first search_cars call
+        self._car_search_index = None
+        # Built on the first period query
+        self._sales_timeseries = None
+
+    # Display helpers only read self.cars / self.customers / self.sales and
+    # the iter_cars / iter_customers / iter_sales pages below
+    car_status = Showroom.car_status
+    iter_cars_display = Showroom.iter_cars_display
+    get_cars_display = Showroom.get_cars_display
+    display_cars = Showroom.display_cars
+    iter_customers_display = Showroom.iter_customers_display
+    get_customers_display = Showroom.get_customers_display
+    display_customers = Showroom.display_customers
+    iter_sales_display = Showroom.iter_sales_display
+    get_sales_display = Showroom.get_sales_display
+    display_sales = Showroom.display_sales
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _wrote(self, count=1):
+        self._pending += count
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        self._connection.commit()
+        self._pending = 0
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    @property
+    def cars(self):
+        return _QueryView(
+            self._connection,
+            f"SELECT {CAR_COLUMNS} FROM cars WHERE removed = 0 ORDER BY rowid",
+            "SELECT COUNT(*) FROM cars WHERE removed = 0",
+            _car_from_row,
+        )
+
+    @property
+    def customers(self):
+        return _QueryView(
+            self._connection,
+            "SELECT customer_id, name, contact FROM customers ORDER BY rowid",
+            "SELECT COUNT(*) FROM customers",
+            lambda row: Customer(*row),
+        )
+
+    @property
+    def sales(self):
+        # One joined query instead of two lookups per sale
+        return _QueryView(
+            self._connection,
+            f"SELECT {SALE_COLUMNS}"
+            " FROM sales JOIN cars USING (car_key) JOIN customers USING (customer_id)"
+            " ORDER BY sale_id",
+            "SELECT COUNT(*) FROM sales",
+            _sale_from_row,
+        )
+
+    def car_count(self):
+        return len(self.cars)
+
+    def customer_count(self):
+        return len(self.customers)
+
+    def _page(self, select_sql, key, offset, limit, after_id, make_item):
+        # after_id is a seek on the primary key; OFFSET makes SQLite step over
+        # the skipped rows, so keyset paging is the fast way through a big table
+        sql = select_sql
+        params = []
+        if after_id is not None:
+            sql += f" AND {key} > ?"
+            params.append(after_id)
+        sql += f" ORDER BY {key} LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        for row in self._connection.execute(sql, params):
+            yield make_item(row)
+
+    def iter_cars(self, offset=0, limit=None, after_id=None):
+        return self._page(f"SELECT {CAR_COLUMNS} FROM cars WHERE removed = 0",
+                          "car_id", offset, limit, after_id, _car_from_row)
+
+    def iter_customers(self, offset=0, limit=None, after_id=None):
+        return self._page("SELECT customer_id, name, contact FROM customers WHERE 1",
+                          "customer_id", offset, limit, after_id, lambda row: Customer(*row))
+
+    def iter_sales(self, offset=0, limit=None):
+        # Sales are never deleted and sale_id is the rowid, so sale number n
+        # is sale_id n and a page is a range seek rather than an OFFSET
+        return self._page(
+            f"SELECT {SALE_COLUMNS}"
+            " FROM sales JOIN cars USING (car_key) JOIN customers USING (customer_id) WHERE 1",
+            "sale_id", 0, limit, offset, _sale_from_row)
+
+    def get_car(self, car_id):
+        sql = f"SELECT {CAR_COLUMNS} FROM cars WHERE car_id = ? AND removed = 0"
+        row = self._connection.execute(sql, (car_id,)).fetchone()
+        return _car_from_row(row) if row else None
+
+    def get_customer(self, customer_id):
+        row = self._connection.execute(
+            "SELECT customer_id, name, contact FROM customers WHERE customer_id = ?",
+            (customer_id,),
+        ).fetchone()
+        return Customer(*row) if row else None
+
+    # The cars_car_id index only covers cars that are not removed, so a
+    # removed car's ID can be added again, as a new row
+    INSERT_CAR_SQL = (
+        "INSERT OR IGNORE INTO cars (car_id, brand, model, year, price, image_path, is_available)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    def add_car(self, car):
+        cursor = self._connection.execute(self.INSERT_CAR_SQL, _car_params(car))
+        if cursor.rowcount == 0:
+            return False
+        self._index_car_texts([car])
+        self._wrote()
+        return True
+
+    def add_cars(self, cars):
+        """Insert many cars with one executemany call and commit them.
+        Cars whose ID is already taken are skipped. Returns the number added."""
+        cars = list(cars)
+        cursor = self._connection.executemany(self.INSERT_CAR_SQL, map(_car_params, cars))
+        self._index_car_texts(cars)
+        self.flush()
+        return cursor.rowcount
+
+    # Car search keeps a TrigramIndex in memory over the distinct
+    # (brand, model) pairs only, then fetches the cars for the best pairs
+    # through the cars_brand_model index. Pairs whose cars were all removed
+    # stay in the index and simply find no rows.
+
+    def _index_car_texts(self, cars):
+        if self._car_search_index is not None:
+            for car in cars:
+                self._car_search_index.add((car.brand, car.model), _car_search_text(car))
+
+    def search_cars(self, query, limit=10, available_only=False):
+        """Showroom.search_cars, for the cars in the database."""
+        if self._car_search_index is None:
+            self._car_search_index = TrigramIndex()
+            pairs = self._connection.execute("SELECT DISTINCT brand, model FROM cars WHERE removed = 0")
+            self._index_car_texts(Car(None, brand, model, None, None) for brand, model in pairs)
+        sql = f"SELECT {CAR_COLUMNS} FROM cars WHERE brand = ? AND model = ? AND removed = 0"
+        if available_only:
+            sql += " AND is_available = 1"
+        sql += " ORDER BY car_id LIMIT ?"
+        found = []
+        for (brand, model), _ in self._car_search_index.search(query):
+            if len(found) >= limit:
+                break
+            rows = self._connection.execute(sql, (brand, model, limit - len(found)))
+            found.extend(_car_from_row(row) for row in rows)
+        return found
+
+    def add_customers(self, customers):
+        customers = list(customers)
+        cursor = self._connection.executemany(
+            "INSERT OR IGNORE INTO customers (customer_id, name, contact) VALUES (?, ?, ?)",
+            ((c.customer_id, c.name, c.contact) for c in customers),
+        )
+        added = cursor.rowcount
+        self._index_customers(customers)
+        self.flush()
+        return added
+
+    def _index_customers(self, customers):
+        # Keys are only added for the customer actually stored under that
+        # ID, so a rejected duplicate leaves the index alone
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO customer_search (key, customer_id)"
+            " SELECT ?, customer_id FROM customers WHERE customer_id = ? AND name = ? AND contact = ?",
+            ((key, c.customer_id, c.name, c.contact) for c in customers for key in _customer_search_keys(c)),
+        )
+
+    def search_customers(self, prefix, limit=10):
+        """Showroom.search_customers, as a range scan of customer_search."""
+        prefix = " ".join(prefix.split()).casefold()
+        if not prefix:
+            return []
+        found = {}
+        rows = self._connection.execute(
+            "SELECT customer_id FROM customer_search WHERE key >= ? AND key < ? ORDER BY key",
+            (prefix, prefix + "\U0010ffff"),
+        )
+        for (customer_id,) in rows:
+            found[customer_id] = None
+            if len(found) == limit:
+                break
+        return [self.get_customer(customer_id) for customer_id in found]
+
+    def remove_car(self, car_id):
+        cursor = self._connection.execute(
+            "UPDATE cars SET removed = 1 WHERE car_id = ? AND removed = 0", (car_id,)
+        )
+        if cursor.rowcount == 0:
+            return False
+        self._connection.execute("DELETE FROM reservations WHERE car_id = ?", (car_id,))
+        self._wrote()
+        return True
+
+    def cars_in_price_range(self, min_price=None, max_price=None):
+        return self._available_cars_between("price", min_price, max_price)
+
+    def cars_in_year_range(self, start_year=None, end_year=None):
+        return self._available_cars_between("year", start_year, end_year)
+
+    def _available_cars_between(self, column, low, high):
+        sql = f"SELECT {CAR_COLUMNS} FROM cars WHERE is_available = 1 AND removed = 0"
+        params = []
+        if low is not None:
+            sql += f" AND {column} >= ?"
+            params.append(low)
+        if high is not None:
+            sql += f" AND {column} <= ?"
+            params.append(high)
+        sql += f" ORDER BY {column}, car_id"
+        return [_car_from_row(row) for row in self._connection.execute(sql, params)]
+
+    def get_stats(self):
+        """The figures from Showroom.get_stats, computed with aggregate
+        queries over the indexed tables."""
+        total_cars, available_cars, inventory_value = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(is_available), 0),"
+            " COALESCE(SUM(CASE WHEN is_available = 1 THEN price END), 0)"
+            " FROM cars WHERE removed = 0"
+        ).fetchone()
+        sales, revenue = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(price), 0) FROM sales"
+        ).fetchone()
+        return {
+            'total_cars': total_cars,
+            'available_cars': available_cars,
+            'sold_cars': total_cars - available_cars,
+            'customers': self.customer_count(),
+            'sales': sales,
+            'reserved_cars': self.reserved_count(),
+            'inventory_value': inventory_value,
+            'revenue': revenue,
+            'available_by_brand': dict(self._connection.execute(
+                "SELECT brand, COUNT(*) FROM cars WHERE is_available = 1 AND removed = 0 GROUP BY brand"
+            )),
+        }
+
+    def add_customer(self, customer):
+        try:
+            self._connection.execute(
+                "INSERT INTO customers (customer_id, name, contact) VALUES (?, ?, ?)",
+                (customer.customer_id, customer.name, customer.contact),
+            )
+        except sqlite3.IntegrityError:
+            return False
+        self._index_customers([customer])
+        self._wrote()
+        return True
+
+    SELL_CAR_SQL = "UPDATE cars SET is_available = 0 WHERE car_id = ? AND removed = 0"
+    # Sales point at the car's row, which stays as it was sold even if the
+    # car is removed and its ID reused
+    INSERT_SALE_SQL = (
+        "INSERT INTO sales (car_key, customer_id, sold_at, price)"
+        " SELECT car_key, ?, ?, ? FROM cars WHERE car_id = ? AND removed = 0"
+    )
+
+    def sell_car(self, car_id, customer_id, sold_at=None):
+        car = self.get_car(car_id)
+        if not car:
+            return f"Car with ID {car_id} not found."
+
+        if not car.is_available:
+            return f"Car with ID {car_id} is already sold."
+
+        customer = self.get_customer(customer_id)
+        if not customer:
+            return f"Customer with ID {customer_id} not found."
+
+        hold = self.get_reservation(car_id)
+        if hold is not None and hold[0] != customer_id:
+            return f"Car with ID {car_id} is reserved until {_format_time(hold[1])}."
+
+        # Process sale
+        if sold_at is None:
+            sold_at = time.time()
+        self._connection.execute(self.SELL_CAR_SQL, (car_id,))
+        self._connection.execute(self.INSERT_SALE_SQL, (customer_id, sold_at, car.price, car_id))
+        self._connection.execute("DELETE FROM reservations WHERE car_id = ?", (car_id,))
+        car.is_available = False
+        if self._sales_timeseries is not None:
+            self._sales_timeseries.record(sold_at, car.price)
+        self._wrote(2)
+        return f"Car '{car}' sold to '{customer}'"
+
+    def sell_cars(self, car_ids, customer_id, sold_at=None):
+        """Showroom.sell_cars. The cars and their holds are read with one
+        query per few hundred IDs, and all the writes are committed in one
+        transaction, so a failure part way through leaves nothing sold."""
+        car_ids = list(car_ids)
+        customer = self.get_customer(customer_id)
+        if not customer:
+            return f"Customer with ID {customer_id} not found."
+
+        cars = {}
+        holds = {}
+        now = time.time()
+        # Stay well under SQLite's limit on the number of ? parameters
+        for start in range(0, len(car_ids), 500):
+            chunk = car_ids[start:start + 500]
+            marks = ", ".join("?" * len(chunk))
+            for row in self._connection.execute(
+                    f"SELECT {CAR_COLUMNS} FROM cars WHERE removed = 0 AND car_id IN ({marks})", chunk):
+                cars[row[0]] = _car_from_row(row)
+            for car_id, holder, expires_at in self._connection.execute(
+                    "SELECT car_id, customer_id, expires_at FROM reservations"
+                    f" WHERE expires_at > ? AND car_id IN ({marks})", [now, *chunk]):
+                holds[car_id] = (holder, expires_at)
+        cars, error = _check_batch_cars(car_ids, customer_id, cars.get, holds.get)
+        if error:
+            return error
+
+        if sold_at is None:
+            sold_at = now
+        self.flush()
+        with self._connection:
+            self._connection.executemany(self.SELL_CAR_SQL, ((car.car_id,) for car in cars))
+            self._connection.executemany(
+                self.INSERT_SALE_SQL, ((customer_id, sold_at, car.price, car.car_id) for car in cars))
+            self._connection.executemany(
+                "DELETE FROM reservations WHERE car_id = ?", ((car.car_id,) for car in cars))
+        for car in cars:
+            car.is_available = False
+        if self._sales_timeseries is not None:
+            self._sales_timeseries.record(sold_at, sum(car.price for car in cars), len(cars))
+        return f"{len(cars)} cars sold to '{customer}'"
+
+    # The reservations_expires_at index plays the part of Showroom's heap:
+    # reads skip expired rows with a time condition, and each write first
+    # deletes the expired rows from the front of the index
+
+    def reserve_car(self, car_id, customer_id, hours=RESERVATION_HOURS, expires_at=None):
+        """Showroom.reserve_car, stored in the reservations table."""
+        expires_at, until = _hold_expiry(hours, expires_at)
+        car = self.get_car(car_id)
+        if not car:
+            return f"Car with ID {car_id} not found."
+
+        if not car.is_available:
+            return f"Car with ID {car_id} is already sold."
+
+        customer = self.get_customer(customer_id)
+        if not customer:
+            return f"Customer with ID {customer_id} not found."
+
+        hold = self.get_reservation(car_id)
+        if hold is not None and hold[0] != customer_id:
+            return f"Car with ID {car_id} is reserved until {_format_time(hold[1])}."
+
+        self._expire_reservations()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO reservations (car_id, customer_id, expires_at) VALUES (?, ?, ?)",
+            (car_id, customer_id, expires_at),
+        )
+        self._wrote()
+        return f"Car '{car}' reserved for '{customer}' until {until}"
+
+    def release_reservation(self, car_id):
+        self._expire_reservations()
+        cursor = self._connection.execute("DELETE FROM reservations WHERE car_id = ?", (car_id,))
+        if cursor.rowcount == 0:
+            return False
+        self._wrote()
+        return True
+
+    def _expire_reservations(self):
+        self._connection.execute("DELETE FROM reservations WHERE expires_at <= ?", (time.time(),))
+
+    def get_reservation(self, car_id):
+        return self._connection.execute(
+            "SELECT customer_id, expires_at FROM reservations WHERE car_id = ? AND expires_at > ?",
+            (car_id, time.time()),
+        ).fetchone()
+
+    def reserved_count(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM reservations WHERE expires_at > ?", (time.time(),)
+        ).fetchone()[0]
+
+    def iter_reservations(self):
+        return iter(self._connection.execute(
+            "SELECT car_id, customer_id, expires_at FROM reservations WHERE expires_at > ? ORDER BY car_id",
+            (time.time(),),
+        ).fetchall())
+
+    # Period queries use the same in-memory rollups as Showroom, built from
+    # the sales table with one scan the first time they are needed and kept
+    # up to date by sell_car after that
+
+    def _timeseries(self):
+        if self._sales_timeseries is None:
+            self._sales_timeseries = SalesTimeSeries()
+            rows = self._connection.execute(
+                "SELECT sold_at, price FROM sales ORDER BY sale_id")
+            for sold_at, price in rows:
+                self._sales_timeseries.record(sold_at, price)
+        return self._sales_timeseries
+
+    def sales_by_period(self, period="day", start=None, end=None):
+        return self._timeseries().series(period, start, end)
+
+    def sales_between(self, start, end):
+        return self._timeseries().totals(start, end)
+
+    def sales_this(self, period="week", today=None):
+        return self._timeseries().current(period, today)
@@ -0,0 +1,107 @@
+import os
+from collections import OrderedDict
+
+# Bytes a thumbnail is counted as per pixel (decoded RGBA)
+BYTES_PER_PIXEL = 4
+
+class ThumbnailCache:
+    """Decoded, resized images kept in memory, least recently used dropped
+    first.
+
+    get(path, size) returns load(path, size) for the image file at path,
+    calling load only the first time: entries are keyed by path,
+    modification time and size, so a file that is replaced on disk is
+    loaded again and its old thumbnail dropped, while redrawing the same
+    cards never decodes anything. Each thumbnail is counted as width x
+    height x 4 bytes; once they add up to more than max_bytes the least
+    recently used are dropped. hits and misses count lookups.
+    """
+
+    def __init__(self, load, max_bytes=64 * 2 ** 20):
+        self.load = load
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # (path, mtime, size) -> thumbnail, least recently used first
+        self._entries = OrderedDict()
+        # path -> (mtime, size) keys it is cached under, to drop stale ones
+        self._keys_by_path = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path, size):
+        """The thumbnail of the file at path resized to size (width,
+        height). Raises OSError if the file cannot be read."""
+        key = (path, os.stat(path).st_mtime_ns, size)
+        thumbnail = self._entries.get(key)
+        if thumbnail is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return thumbnail
+        self.misses += 1
+        thumbnail = self.load(path, size)
+        # Drop thumbnails of an older version of the file first: dropping
+        # the last of them removes the path's key set
+        for stale in [old for old in self._keys_by_path.get(path, ()) if old[0] != key[1]]:
+            self._drop((path, *stale))
+        self._entries[key] = thumbnail
+        self._keys_by_path.setdefault(path, set()).add(key[1:])
+        self.bytes += _cost(size)
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+        return thumbnail
+
+    def report(self):
+        lookups = self.hits + self.misses
+        rate = 100 * self.hits / lookups if lookups else 0
+        return (f"Thumbnail cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate), "
+                f"{len(self._entries)} thumbnails in {self.bytes / 2 ** 20:.1f} of {self.max_bytes / 2 ** 20:.1f} MiB")
+
+    def clear(self):
+        self._entries.clear()
+        self._keys_by_path.clear()
+        self.bytes = 0
+
+    def _drop(self, key):
+        del self._entries[key]
+        path = key[0]
+        keys = self._keys_by_path[path]
+        keys.discard(key[1:])
+        if not keys:
+            del self._keys_by_path[path]
+        self.bytes -= _cost(key[2])
+
+def _cost(size):
+    width, height = size
+    return width * height * BYTES_PER_PIXEL
+
+def check_replaced_file():
+    """Cache a file, replace it (new mtime), then evict everything: the
+    byte count must follow the entries and every eviction must succeed.
+    Run with python thumbnail_cache.py."""
+    import tempfile
+    size = (200, 150)
+    loads = []
+    cache = ThumbnailCache(lambda path, size: loads.append(path) or object(), max_bytes=2 * _cost(size))
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f"{i}.jpg") for i in range(4)]
+        for path in paths:
+            with open(path, "w") as f:
+                f.write("x")
+        cache.get(paths[0], size)
+        cache.get(paths[0], size)
+        stat = os.stat(paths[0])
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        cache.get(paths[0], size)
+        assert loads == [paths[0], paths[0]]
+        for path in paths[1:]:
+            cache.get(path, size)
+        assert len(cache) == 2 and cache.bytes == 2 * _cost(size)
+        assert sorted(cache._keys_by_path) == sorted(paths[2:])
+    assert (cache.hits, cache.misses) == (1, 5)
+    return cache
+
+if __name__ == "__main__":
+    print(check_replaced_file().report())
@@ -0,0 +1,136 @@
+import re
+from collections import Counter
+from sorted_index import SortedIds
+
+def trigrams(word):
+    """The word's three-letter pieces, padded the way PostgreSQL's pg_trgm
+    does ("  ab", " ab", "ab ") so short words and word starts still
+    count."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def similarity(a, b):
+    """Trigram similarity of two words: shared trigrams over all trigrams
+    (1.0 for equal words, 0.0 for nothing in common)."""
+    a, b = trigrams(a), trigrams(b)
+    return len(a & b) / len(a | b)
+
+class TrigramIndex:
+    """Typo-tolerant search over short texts such as "Mercedes C-Class".
+
+    Items are indexed under a text; each distinct text is split into
+    case-folded words (runs of letters and digits, so "CX-5" is "cx" and
+    "5"), and each distinct word is filed under its trigrams.
+    A query word is compared only with the words that share a trigram with
+    it, so a search costs time in proportion to the vocabulary (a few
+    hundred brands and models), not the number of items: a hundred thousand
+    cars of the same make share one text entry, and their IDs are kept in
+    one SortedIds array at 8 bytes each.
+    """
+
+    def __init__(self):
+        # text -> SortedIds of the items filed under it
+        self._items_by_text = {}
+        # word -> set of texts containing it
+        self._texts_by_word = {}
+        # trigram -> set of words containing it
+        self._words_by_trigram = {}
+        self._trigram_counts = {}
+
+    def __len__(self):
+        return sum(len(items) for items in self._items_by_text.values())
+
+    def add(self, item_id, text):
+        items = self._items_by_text.get(text)
+        if items is None:
+            items = self._items_by_text[text] = SortedIds()
+            for word in _words(text):
+                self._add_word(word, text)
+        if item_id in items:
+            return False
+        items.add(item_id)
+        return True
+
+    def remove(self, item_id, text):
+        items = self._items_by_text.get(text)
+        if items is None or not items.remove(item_id):
+            return False
+        if not items:
+            del self._items_by_text[text]
+            for word in _words(text):
+                self._remove_word(word, text)
+        return True
+
+    def _add_word(self, word, text):
+        texts = self._texts_by_word.get(word)
+        if texts is None:
+            texts = self._texts_by_word[word] = set()
+            grams = trigrams(word)
+            self._trigram_counts[word] = len(grams)
+            for gram in grams:
+                self._words_by_trigram.setdefault(gram, set()).add(word)
+        texts.add(text)
+
+    def _remove_word(self, word, text):
+        texts = self._texts_by_word[word]
+        texts.discard(text)
+        if not texts:
+            del self._texts_by_word[word]
+            del self._trigram_counts[word]
+            for gram in trigrams(word):
+                words = self._words_by_trigram[gram]
+                words.discard(word)
+                if not words:
+                    del self._words_by_trigram[gram]
+
+    def _similar_words(self, query_word, threshold):
+        grams = trigrams(query_word)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._words_by_trigram.get(gram, ()))
+        matches = {}
+        for word, count in shared.items():
+            score = count / (len(grams) + self._trigram_counts[word] - count)
+            if score >= threshold:
+                matches[word] = score
+        return matches
+
+    def rank(self, query, threshold=0.3):
+        """(score, text) pairs for the texts that match query, best first.
+
+        Each query word is scored against its most similar word in the
+        text; a text's score is the mean over the query words, so every
+        word of "toyta camr" has to find a match for a full score."""
+        query_words = _words(query)
+        if not query_words:
+            return []
+        scores = Counter()
+        for query_word in query_words:
+            best = {}
+            for word, score in self._similar_words(query_word, threshold).items():
+                for text in self._texts_by_word[word]:
+                    if score > best.get(text, 0.0):
+                        best[text] = score
+            scores.update(best)
+        return sorted(((score / len(query_words), text) for text, score in scores.items()),
+                      key=lambda pair: (-pair[0], pair[1]))
+
+    def search(self, query, threshold=0.3, chunk_size=256):
+        """Yield (item_id, score) for every item whose text matches query,
+        best match first (ties in ID order). Lazy, so taking the top k
+        stops early."""
+        for score, text in self.rank(query, threshold):
+            offset = 0
+            while True:
+                items = self._items_by_text.get(text)
+                chunk = items.page(offset, chunk_size) if items is not None else ()
+                if not chunk:
+                    break
+                for item_id in chunk:
+                    yield item_id, score
+                offset += len(chunk)
+
+_WORD = re.compile(r"[^\W_]+")
+
+def _words(text):
+    return list(dict.fromkeys(_WORD.findall(text.casefold())))